@@ -0,0 +1,111 @@
+"""
+Async Parallel Chain Example
+Same notes + quiz chain as Parallel.py, but run asynchronously over many texts.
+RunnableParallel.ainvoke runs both branches at the same time, and abatch runs up
+to `max_concurrency` texts at once, so one text costs about as long as its
+slowest branch instead of the sum of both.
+
+Needs huggingface_hub >= 1.0. From that version on, each AsyncInferenceClient
+keeps one pooled httpx client open, so connections are reused across requests.
+"""
+
+import asyncio
+import time
+
+import httpx
+from dotenv import load_dotenv
+from huggingface_hub import set_async_client_factory
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import PromptTemplate
+from langchain_core.runnables import RunnableParallel
+from langchain_huggingface import ChatHuggingFace, HuggingFaceEndpoint
+
+load_dotenv()
+
+MAX_CONCURRENCY = 16
+
+
+def pooled_async_client():
+    """httpx client with keep-alive connections sized for our concurrency."""
+    return httpx.AsyncClient(
+        follow_redirects=True,
+        timeout=httpx.Timeout(120.0, connect=10.0),
+        limits=httpx.Limits(
+            max_connections=MAX_CONCURRENCY * 2,
+            max_keepalive_connections=MAX_CONCURRENCY * 2,
+            keepalive_expiry=60.0,
+        ),
+    )
+
+
+# Must be set before the endpoints below create their AsyncInferenceClient
+set_async_client_factory(pooled_async_client)
+
+llm1 = HuggingFaceEndpoint(
+    repo_id="mistralai/Mistral-7B-Instruct-v0.2",
+    task="text-generation"
+)
+llm2 = HuggingFaceEndpoint(
+    repo_id="deepseek-ai/DeepSeek-V3.1",
+    task="text-generation"
+)
+
+model1 = ChatHuggingFace(llm=llm1)
+model2 = ChatHuggingFace(llm=llm2)
+
+prompt1 = PromptTemplate(
+    template="Generate short and simple notes from the following text:\n{text}",
+    input_variables=["text"]
+)
+prompt2 = PromptTemplate(
+    template="Generate 5 short question-answers from the following text:\n{text}",
+    input_variables=["text"]
+)
+prompt3 = PromptTemplate(
+    template="Merge the provided notes and quiz into a single document.\nNotes: {notes}\nQuiz: {quiz}",
+    input_variables=["notes", "quiz"]
+)
+
+parser = StrOutputParser()
+
+parallel_chain = RunnableParallel({
+    "notes": prompt1 | model1 | parser,
+    "quiz": prompt2 | model2 | parser
+})
+
+merge_chain = prompt3 | model1 | parser
+
+chain = parallel_chain | merge_chain
+
+
+async def run_many(texts, max_concurrency=MAX_CONCURRENCY):
+    """Run the chain over every text, at most `max_concurrency` at a time."""
+    return await chain.abatch(
+        [{"text": text} for text in texts],
+        config={"max_concurrency": max_concurrency},
+        return_exceptions=True,  # one failed request should not sink the batch
+    )
+
+
+async def close_clients():
+    """Close the pooled HTTP connections held by each endpoint."""
+    await asyncio.gather(llm1.async_client.close(), llm2.async_client.close())
+
+
+async def main():
+    texts = [f"Your SVM text... (part {i})" for i in range(50)]
+
+    start = time.perf_counter()
+    try:
+        results = await run_many(texts)
+    finally:
+        await close_clients()
+    elapsed = time.perf_counter() - start
+
+    failures = [r for r in results if isinstance(r, Exception)]
+    print(f"Processed {len(texts)} texts in {elapsed:.1f}s ({len(failures)} failed)")
+    print(results[0])
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,271 @@
+"""
+Cached Chain Example
+Same prompt | model | parser chain as Simple.py, with a two-level response cache
+in front of ChatHuggingFace:
+
+  1. Exact:    hash of the rendered messages + model id + generation params
+  2. Semantic: cosine similarity of the prompt embedding against cached prompts
+
+Both levels share one SQLite store with a TTL and LRU eviction. Only prompts
+that miss both levels are sent to the model. The prompt vectors are also kept in
+memory as one normalized matrix per scope, so a semantic lookup is a single
+matrix-vector product instead of reading every row back from SQLite.
+
+A semantic hit returns the answer to a *different* prompt. With all-MiniLM-L6-v2,
+0.97 catches case / punctuation / word-order variants; around 0.9 it starts
+matching prompts that differ in a detail that changes the answer ("facts about
+cricket" vs "facts about cricket in 1900"). Lower the threshold only where close
+enough is good enough, and pass semantic=False to cached_model for chains where
+only an exact repeat may be answered from the cache.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+import numpy as np
+from dotenv import load_dotenv
+from langchain_core.messages import AIMessage
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import PromptTemplate
+from langchain_core.runnables import RunnableLambda
+from langchain_huggingface import ChatHuggingFace, HuggingFaceEmbeddings, HuggingFaceEndpoint
+
+load_dotenv()
+
+
+class ScopeVectors:
+    """Normalized prompt vectors of one scope as a growable matrix; removed rows are masked, then compacted."""
+
+    def __init__(self):
+        self.keys = []
+        self.rows = {}          # key -> row in matrix
+        self.matrix = None      # (capacity, dim), rows [0, size) in use
+        self.created = np.empty(0)
+        self.alive = np.empty(0, dtype=bool)
+        self.size = 0
+
+    def add(self, key, vector, created):
+        if self.matrix is None or self.size == len(self.matrix):
+            capacity = max(64, 2 * self.size)  # doubling keeps appends amortized O(dim)
+            matrix = np.zeros((capacity, len(vector)), dtype=np.float32)
+            if self.matrix is not None:
+                matrix[:self.size] = self.matrix[:self.size]
+            self.matrix = matrix
+            self.created = np.resize(self.created, capacity)
+            self.alive = np.resize(self.alive, capacity)
+        self.matrix[self.size] = vector
+        self.created[self.size] = created
+        self.alive[self.size] = True
+        self.keys.append(key)
+        self.rows[key] = self.size
+        self.size += 1
+
+    def remove(self, keys):
+        for key in keys:
+            row = self.rows.pop(key, None)
+            if row is not None:
+                self.alive[row] = False
+        if self.size > 64 and len(self.rows) < self.size // 2:
+            self._compact()
+
+    def _compact(self):
+        keep = np.flatnonzero(self.alive[:self.size])
+        self.matrix[:len(keep)] = self.matrix[keep]
+        self.created[:len(keep)] = self.created[keep]
+        self.alive[:len(keep)] = True
+        self.keys = [self.keys[i] for i in keep]
+        self.rows = {key: i for i, key in enumerate(self.keys)}
+        self.size = len(keep)
+
+    def nearest(self, query, not_before, threshold):
+        if not self.rows:
+            return None
+        scores = self.matrix[:self.size] @ query
+        scores[~self.alive[:self.size] | (self.created[:self.size] < not_before)] = -np.inf
+        best = int(np.argmax(scores))
+        return self.keys[best] if scores[best] >= threshold else None
+
+
+class ResponseCache:
+    """SQLite-backed exact + semantic cache of model responses."""
+
+    def __init__(self, path="llm_cache.sqlite", embeddings=None, threshold=0.97,
+                 ttl_seconds=24 * 3600, max_entries=10_000):
+        self.embeddings = embeddings
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+        # chain.batch / ainvoke call the cache from executor threads, so the one
+        # connection is shared across threads and every access holds _lock
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, scope TEXT NOT NULL, vector BLOB, response TEXT NOT NULL, "
+            "created REAL NOT NULL, last_used REAL NOT NULL)"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS idx_scope ON responses(scope)")
+        self.db.execute("CREATE INDEX IF NOT EXISTS idx_created ON responses(created)")
+        self.db.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON responses(last_used)")
+        self.db.commit()
+        self._scopes = {}  # scope -> ScopeVectors, loaded on first semantic lookup
+
+    # ------------------ Lookup ------------------
+    def lookup(self, key, scope, prompt_text, semantic=True):
+        """Return (cached response or None, prompt vector or None), trying the exact key first.
+
+        Pass the vector on to store() after a miss so the prompt is embedded only once.
+        """
+        now = time.time()
+        with self._lock:
+            row = self.db.execute(
+                "SELECT response FROM responses WHERE key = ? AND created >= ?", (key, now - self.ttl_seconds)
+            ).fetchone()
+            if row is not None:
+                self.exact_hits += 1
+                self._touch(key, now)
+                return row[0], None
+            if self.embeddings is None or not semantic:
+                self.misses += 1
+                return None, None
+
+        query = self._embed(prompt_text)  # outside the lock, it is the slow part
+        with self._lock:
+            match = self._nearest(scope, query, now)
+            if match is not None:
+                row = self.db.execute("SELECT response FROM responses WHERE key = ?", (match,)).fetchone()
+                if row is not None:
+                    self.semantic_hits += 1
+                    self._touch(match, now)
+                    return row[0], query
+            self.misses += 1
+        return None, query
+
+    def _scope(self, scope):
+        """The in-memory vectors of one scope, read from SQLite the first time it is used."""
+        if scope not in self._scopes:
+            vectors = self._scopes[scope] = ScopeVectors()
+            for key, created, blob in self.db.execute(
+                "SELECT key, created, vector FROM responses WHERE scope = ? AND vector IS NOT NULL", (scope,)
+            ):
+                vectors.add(key, np.frombuffer(blob, dtype=np.float32), created)
+        return self._scopes[scope]
+
+    def _nearest(self, scope, query, now):
+        """Key of the best unexpired semantic match within the same model/params scope, if above threshold."""
+        return self._scope(scope).nearest(query, now - self.ttl_seconds, self.threshold)
+
+    def _embed(self, text):
+        vector = np.asarray(self.embeddings.embed_query(text), dtype=np.float32)
+        return vector / (np.linalg.norm(vector) or 1.0)
+
+    def _touch(self, key, now):
+        self.db.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+        self.db.commit()
+
+    # ------------------ Store ------------------
+    def store(self, key, scope, prompt_text, response, vector=None):
+        now = time.time()
+        if vector is None and self.embeddings is not None:
+            vector = self._embed(prompt_text)
+        blob = vector.tobytes() if vector is not None else None
+        with self._lock:
+            # Expired and least recently used entries are purged here, on writes only
+            stale = [old for old, in self.db.execute(
+                "SELECT key FROM responses WHERE created < ? UNION "
+                "SELECT key FROM (SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (now - self.ttl_seconds, self.max_entries - 1),
+            )]
+            stale.append(key)  # replaced below, so its old vector goes too
+            self.db.executemany("DELETE FROM responses WHERE key = ?", [(k,) for k in stale])
+            for vectors in self._scopes.values():
+                vectors.remove(stale)
+            self.db.execute(
+                "INSERT INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, scope, blob, response, now, now),
+            )
+            self.db.commit()
+            if vector is not None and scope in self._scopes:
+                self._scopes[scope].add(key, vector, now)
+
+    def stats(self):
+        """Return hit counters and hit rates for both cache levels."""
+        total = self.exact_hits + self.semantic_hits + self.misses
+        return {
+            "exact_hits": self.exact_hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+            "hit_rate": (self.exact_hits + self.semantic_hits) / total if total else 0.0,
+            "exact_hit_rate": self.exact_hits / total if total else 0.0,
+            "semantic_hit_rate": self.semantic_hits / total if total else 0.0,
+        }
+
+
+def cached_model(model, cache, model_id, params, semantic=True):
+    """Wrap a chat model in a RunnableLambda that consults `cache` first.
+
+    semantic=False answers only exact repeats from the cache for this chain.
+    """
+    # Requests with different models or params must never share answers
+    scope = hashlib.sha256(json.dumps({"model": model_id, **params}, sort_keys=True).encode()).hexdigest()
+
+    def invoke(prompt_value):
+        messages = prompt_value.to_messages()
+        rendered = json.dumps([[m.type, m.content] for m in messages], ensure_ascii=False)
+        key = hashlib.sha256(f"{scope}\0{rendered}".encode("utf-8")).hexdigest()
+        prompt_text = "\n".join(str(m.content) for m in messages)
+
+        cached, vector = cache.lookup(key, scope, prompt_text, semantic)
+        if cached is not None:
+            return AIMessage(content=cached)
+
+        result = model.invoke(messages)
+        cache.store(key, scope, prompt_text, result.content, vector)
+        return result
+
+    return RunnableLambda(invoke)
+
+
+if __name__ == "__main__":
+    MODEL_ID = "openai/gpt-oss-120b"
+    PARAMS = {"temperature": 0.7, "max_new_tokens": 512}
+
+    llm = HuggingFaceEndpoint(
+        repo_id=MODEL_ID,
+        task="text-generation",
+        **PARAMS
+    )
+
+    prompt = PromptTemplate(
+        template='Generate 5 interesting facts about {topic}',
+        input_variables=['topic']
+    )
+
+    model = ChatHuggingFace(llm = llm)
+
+    parser = StrOutputParser()
+
+    # Step 1: Build the cache with a local embedding model for the semantic level
+    cache = ResponseCache(
+        embeddings=HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2"),
+        threshold=0.97,
+    )
+
+    # Step 2: Put the cache between the prompt and the parser
+    chain = prompt | cached_model(model, cache, MODEL_ID, PARAMS) | parser
+
+    # Step 3: Repeated and near-identical topics are answered from the cache
+    for topic in ['cricket', 'cricket', 'Cricket', 'football']:
+        start = time.perf_counter()
+        result = chain.invoke({'topic': topic})
+        print(f"{topic!r}: {time.perf_counter() - start:.2f}s")
+
+    print(result)
+    print(cache.stats())
@@ -0,0 +1,221 @@
+"""
+Async Bulk Web Loader Example
+WebBaseLoader in Webbase_Loader.py fetches one URL at a time. For thousands of
+product pages this loader instead:
+  - shares one pooled aiohttp session, with total and per-host connection limits
+  - sends conditional requests (If-None-Match / If-Modified-Since) from a local
+    SQLite cache, so unchanged pages come back as an empty 304; new bodies are
+    committed in batches, not once per page on the event loop
+  - parses HTML in a process pool, so BeautifulSoup never blocks the event loop
+
+Usage:
+  python Async_Webbase_Loader.py --bench 500     # pages/sec against a local test server
+"""
+
+import asyncio
+import multiprocessing
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import aiohttp
+from bs4 import BeautifulSoup
+from langchain_core.documents import Document
+
+USER_AGENT = "Mozilla/5.0 (compatible; GenAi-Learning loader)"
+
+
+def parse_html(url, html):
+    """Runs in a worker process: HTML -> (text, metadata), like WebBaseLoader."""
+    soup = BeautifulSoup(html, "html.parser")
+    metadata = {"source": url}
+    if soup.title and soup.title.string:
+        metadata["title"] = soup.title.string.strip()
+    description = soup.find("meta", attrs={"name": "description"})
+    if description and description.get("content"):
+        metadata["description"] = description["content"]
+    if soup.html and soup.html.get("lang"):
+        metadata["language"] = soup.html["lang"]
+    return soup.get_text(separator="\n", strip=True), metadata
+
+
+class ConditionalCache:
+    """URL -> (ETag, Last-Modified, body), stored in SQLite and committed every `commit_every` writes."""
+
+    def __init__(self, path="web_cache.sqlite", commit_every=200):
+        self.db = sqlite3.connect(path)
+        self.commit_every = commit_every
+        self._pending = 0
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body TEXT NOT NULL)"
+        )
+        self.db.commit()
+
+    def get(self, url):
+        return self.db.execute(
+            "SELECT etag, last_modified, body FROM pages WHERE url = ?", (url,)
+        ).fetchone()
+
+    def set(self, url, etag, last_modified, body):
+        self.db.execute("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)", (url, etag, last_modified, body))
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.commit()
+
+    def commit(self):
+        # The commit (fsync) is the slow part, so it is paid once per batch
+        self.db.commit()
+        self._pending = 0
+
+
+class AsyncWebLoader:
+    """Concurrent, cache-aware loader for many URLs."""
+
+    def __init__(self, urls, cache_path="web_cache.sqlite", max_connections=100,
+                 max_per_host=8, parse_workers=None, timeout=30):
+        self.urls = list(urls)
+        self.cache = ConditionalCache(cache_path)
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.parse_workers = parse_workers
+        self.timeout = timeout
+        self.stats = {"fetched": 0, "not_modified": 0, "failed": 0}
+
+    async def _fetch(self, session, url):
+        headers = {}
+        cached = self.cache.get(url)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and cached:
+                self.stats["not_modified"] += 1
+                return cached[2]
+            response.raise_for_status()
+            body = await response.text()
+            self.cache.set(url, response.headers.get("ETag"), response.headers.get("Last-Modified"), body)
+            self.stats["fetched"] += 1
+            return body
+
+    async def alazy_load(self):
+        """Yield Documents as soon as each page is fetched and parsed."""
+        loop = asyncio.get_running_loop()
+        # limit_per_host keeps us polite to any single site while other hosts proceed
+        connector = aiohttp.TCPConnector(limit=self.max_connections, limit_per_host=self.max_per_host,
+                                         ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                         headers={"User-Agent": USER_AGENT}) as session:
+            # Spawned, not forked: this process is running an event loop and aiohttp resolver threads
+            with ProcessPoolExecutor(max_workers=self.parse_workers,
+                                     mp_context=multiprocessing.get_context("spawn")) as pool:
+
+                async def load_one(url):
+                    try:
+                        html = await self._fetch(session, url)
+                    except (aiohttp.ClientError, asyncio.TimeoutError, UnicodeDecodeError):
+                        self.stats["failed"] += 1
+                        return None
+                    try:
+                        text, metadata = await loop.run_in_executor(pool, parse_html, url, html)
+                    except Exception:  # any parser error in the worker; one bad page must not stop the batch
+                        self.stats["failed"] += 1
+                        return None
+                    return Document(page_content=text, metadata=metadata)
+
+                try:
+                    for task in asyncio.as_completed([load_one(url) for url in self.urls]):
+                        document = await task
+                        if document is not None:
+                            yield document
+                finally:
+                    self.cache.commit()
+
+    async def aload(self):
+        return [document async for document in self.alazy_load()]
+
+    def load(self):
+        return asyncio.run(self.aload())
+
+
+# ------------------ Local test server for benchmarking ------------------
+def start_test_server(num_pages):
+    """Serve `num_pages` fake product pages that honour ETag / If-None-Match."""
+    import hashlib
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, like a real server
+
+        def do_GET(self):
+            page = self.path.strip("/")
+            body = (
+                f"<html lang='en'><head><title>Product {page}</title>"
+                f"<meta name='description' content='Laptop model {page}'></head>"
+                f"<body><h1>Product {page}</h1>" + "<p>Great specs and long battery life.</p>" * 50
+                + "</body></html>"
+            ).encode("utf-8")
+            etag = '"' + hashlib.md5(body).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    return server, [f"{base}/{i}" for i in range(num_pages)]
+
+
+def benchmark(num_pages, cache_path="bench_web_cache.sqlite"):
+    import os
+
+    if os.path.exists(cache_path):
+        os.remove(cache_path)
+    server, urls = start_test_server(num_pages)
+    try:
+        # Cold run downloads everything, warm run should be all 304s
+        for label in ("cold", "warm"):
+            loader = AsyncWebLoader(urls, cache_path=cache_path)
+            start = time.perf_counter()
+            docs = loader.load()
+            elapsed = time.perf_counter() - start
+            print(f"{label}: {len(docs)} pages in {elapsed:.2f}s "
+                  f"({len(docs) / elapsed:.0f} pages/sec) {loader.stats}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bench", type=int, metavar="PAGES", help="benchmark against a local test server")
+    args = parser.parse_args()
+
+    if args.bench:
+        benchmark(args.bench)
+    else:
+        url = 'https://www.flipkart.com/apple-macbook-air-m2-16-gb-256-gb-ssd-macos-sequoia-mc7x4hn-a/p/itmdc5308fa78421'
+        docs = AsyncWebLoader([url]).load()
+        for doc in docs:
+            print(doc.metadata)
+            print(doc.page_content[:500])
@@ -0,0 +1,135 @@
+"""
+Map-Reduce Summarization Example
+Text_Loader.py sends the whole file to the model in one call, which breaks once
+the file is longer than the context window and is one long serial generation.
+This script instead:
+  - splits the document into chunks
+  - MAP: summarizes all chunks concurrently (at most `max_concurrency` in flight)
+  - REDUCE: packs the summaries into groups that fit `token_max`, combines the
+    groups concurrently, and repeats until one summary is left
+
+Each round runs in parallel, so latency grows with the depth of the reduce tree
+(log of the document length), not with the number of chunks.
+"""
+
+import asyncio
+import time
+
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import PromptTemplate
+
+map_prompt = PromptTemplate(
+    template=(
+        "You are a helpful literary assistant.\n"
+        "Write a concise summary of the following passage:\n\n{text}"
+    ),
+    input_variables=["text"],
+)
+
+reduce_prompt = PromptTemplate(
+    template=(
+        "You are a helpful literary assistant.\n"
+        "The following are summaries of consecutive parts of one text. Combine them into a "
+        "single concise, insightful summary:\n\n{text}"
+    ),
+    input_variables=["text"],
+)
+
+
+def approx_tokens(text):
+    return len(text) // 4  # ~4 characters per token for English text
+
+
+def pack(summaries, token_max, count_tokens=approx_tokens):
+    """Greedily group consecutive summaries so each group fits in token_max."""
+    groups, current, size = [], [], 0
+    for summary in summaries:
+        tokens = count_tokens(summary)
+        if current and size + tokens > token_max:
+            groups.append(current)
+            current, size = [], 0
+        current.append(summary)
+        size += tokens
+    if current:
+        groups.append(current)
+    return groups
+
+
+async def run_bounded(chain, inputs, max_concurrency):
+    """ainvoke every input with at most max_concurrency in flight, keeping order.
+
+    LLM.abatch is not used because plain (non-chat) LLMs such as HuggingFaceEndpoint
+    generate the prompts of a batch one after another.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(item):
+        async with semaphore:
+            return await chain.ainvoke(item)
+
+    return await asyncio.gather(*(run(item) for item in inputs))
+
+
+async def amap_reduce_summarize(text, llm, chunk_size=4000, chunk_overlap=200, token_max=3000,
+                                max_concurrency=8, count_tokens=approx_tokens, verbose=True):
+    parser = StrOutputParser()
+    map_chain = map_prompt | llm | parser
+    reduce_chain = reduce_prompt | llm | parser
+
+    # Step 1: Split
+    splitter = RecursiveCharacterTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    chunks = splitter.split_text(text)
+    if not chunks:
+        return ""
+
+    # Step 2: Map every chunk concurrently
+    start = time.perf_counter()
+    summaries = await run_bounded(map_chain, [{"text": chunk} for chunk in chunks], max_concurrency)
+    if verbose:
+        print(f"map: {len(chunks)} chunks -> {len(summaries)} summaries ({time.perf_counter() - start:.2f}s)")
+
+    # Step 3: Reduce level by level until a single summary remains
+    depth = 0
+    while len(summaries) > 1 or count_tokens(summaries[0]) > token_max:
+        groups = pack(summaries, token_max, count_tokens)
+        if len(groups) == len(summaries) and len(summaries) > 1:
+            # every summary fills a group on its own; pair them up so the tree still shrinks
+            groups = [summaries[i:i + 2] for i in range(0, len(summaries), 2)]
+        start = time.perf_counter()
+        summaries = await run_bounded(
+            reduce_chain, [{"text": "\n\n".join(group)} for group in groups], max_concurrency
+        )
+        depth += 1
+        if verbose:
+            print(f"reduce level {depth}: {len(groups)} groups ({time.perf_counter() - start:.2f}s)")
+        if len(groups) == 1:
+            break  # one final combine; stop even if the model overshot the budget
+    return summaries[0]
+
+
+def map_reduce_summarize(text, llm, **kwargs):
+    return asyncio.run(amap_reduce_summarize(text, llm, **kwargs))
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+    from langchain_community.document_loaders import TextLoader
+    from langchain_huggingface import HuggingFaceEndpoint
+
+    load_dotenv()
+
+    llm = HuggingFaceEndpoint(
+        repo_id="openai/gpt-oss-120b",
+        task="text-generation"
+    )
+
+    # Load the text document
+    loader = TextLoader("cricket.txt", encoding="utf-8")
+    documents = loader.load()
+    print(f"Loaded {len(documents[0].page_content)} characters")
+
+    start = time.perf_counter()
+    result = map_reduce_summarize(documents[0].page_content, llm, chunk_size=2000, max_concurrency=8)
+    print(f"\n--- Summary ({time.perf_counter() - start:.2f}s) ---\n")
+    print(result)
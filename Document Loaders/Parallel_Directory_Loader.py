@@ -0,0 +1,160 @@
+"""
+Parallel Streaming Ingestion Example
+Parses PDFs in a process pool and streams the pages through a splitter stage
+and a batched embedding stage. Every stage runs concurrently and is connected
+by a bounded queue, so peak memory depends on the queue sizes, not on how many
+files are in the folder.
+
+  parse (N processes) -> [queue] -> split -> [queue] -> embed (batches)
+"""
+
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+from langchain_community.document_loaders import PyPDFLoader
+from langchain_huggingface import HuggingFaceEmbeddings
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+_DONE = object()
+logger = logging.getLogger(__name__)
+
+
+def _parse_pdf(path):
+    """Runs inside a worker process: load one PDF into page Documents."""
+    return PyPDFLoader(path).load()
+
+
+def parse_pdfs(paths, max_workers=None, max_pending=None, stats=None):
+    """Yield page Documents from many PDFs, parsing them on all cores.
+
+    At most `max_pending` files are in flight at a time, so results never pile
+    up faster than the next stage consumes them. A PDF that fails to parse
+    (corrupt, encrypted, ...) is logged and counted in stats["failed"]; the
+    other files carry on.
+    """
+    max_workers = max_workers or os.cpu_count()
+    max_pending = max_pending or max_workers * 2
+    stats = stats if stats is not None else {}
+    stats.setdefault("parsed", 0)
+    stats.setdefault("failed", 0)
+    paths = iter(paths)
+
+    # This runs in buffered()'s producer thread, after torch is loaded: forking a
+    # multi-threaded process can deadlock the workers, so they are spawned fresh
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+        pending = {}  # future -> path
+        try:
+            for path in paths:
+                pending[pool.submit(_parse_pdf, str(path))] = path
+                if len(pending) >= max_pending:
+                    break
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path = pending.pop(future)
+                    next_path = next(paths, None)
+                    if next_path is not None:
+                        pending[pool.submit(_parse_pdf, str(next_path))] = next_path
+                    try:
+                        pages = future.result()
+                    except Exception as exc:
+                        stats["failed"] += 1
+                        logger.warning("Skipping %s: %s: %s", path, type(exc).__name__, exc)
+                        continue
+                    stats["parsed"] += 1
+                    yield from pages
+        finally:
+            for future in pending:  # consumer stopped early: drop the queued files
+                future.cancel()
+
+
+def buffered(iterable, maxsize):
+    """Run `iterable` in a background thread, handing items over a bounded queue.
+
+    If the consumer stops early, the producer notices within a poll interval,
+    stops iterating and exits instead of blocking on a full queue forever.
+    """
+    items = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put(item):
+                    break
+        except BaseException as exc:  # surface producer errors to the consumer
+            put(exc)
+        finally:
+            close = getattr(iterable, "close", None)
+            if close:
+                close()  # runs the generator's cleanup, e.g. shutting down its process pool
+            put(_DONE)
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            item = items.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+
+
+def split_stream(documents, splitter):
+    """Split Documents one at a time as they arrive."""
+    for document in documents:
+        yield from splitter.split_documents([document])
+
+
+def embed_stream(chunks, embeddings, batch_size=64):
+    """Group chunks into batches and yield (chunks, vectors) pairs."""
+    batch = []
+    for chunk in chunks:
+        batch.append(chunk)
+        if len(batch) == batch_size:
+            yield batch, embeddings.embed_documents([doc.page_content for doc in batch])
+            batch = []
+    if batch:
+        yield batch, embeddings.embed_documents([doc.page_content for doc in batch])
+
+
+def ingest_directory(path, embeddings, splitter, glob="*.pdf", max_workers=None,
+                     queue_size=256, batch_size=64, stats=None):
+    """Lazily parse, split and embed every PDF under `path`; `stats` collects parsed / failed counts."""
+    paths = sorted(Path(path).glob(glob))
+    pages = buffered(parse_pdfs(paths, max_workers=max_workers, stats=stats), queue_size)
+    chunks = buffered(split_stream(pages, splitter), queue_size)
+    yield from embed_stream(chunks, embeddings, batch_size=batch_size)
+
+
+if __name__ == "__main__":
+    # Step 1: Set up the splitter and the local embedding model
+    splitter = RecursiveCharacterTextSplitter(chunk_size=500, chunk_overlap=50)
+    embeddings = HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2")
+
+    # Step 2: Stream the resume folder through the pipeline
+    total_chunks = 0
+    stats = {}
+    for chunks, vectors in ingest_directory("resume", embeddings, splitter, stats=stats):
+        total_chunks += len(chunks)
+        print(f"Embedded batch of {len(chunks)} chunks from {chunks[0].metadata.get('source')}")
+
+    print(f"\nTotal chunks embedded: {total_chunks} ({stats['parsed']} PDFs parsed, {stats['failed']} failed)")
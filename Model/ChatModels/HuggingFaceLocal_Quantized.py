@@ -0,0 +1,120 @@
+"""
+Quantized Local Model Example
+CPU-friendly version of HuggingFaceLocal.py:
+  - the model is loaded once per process and reused (load_model is cached)
+  - Linear layer weights are quantized to int8 (torch dynamic quantization)
+    or int4 (optimum-quanto, optional extra)
+  - lists of prompts are generated in batches, grouped by token length so
+    little compute is wasted on padding
+
+See benchmark_local_model.py for load time, tokens/sec and RSS numbers.
+"""
+
+import os
+from functools import lru_cache
+
+# Must be set before the Hugging Face libraries are imported to take effect
+os.environ.setdefault('HF_HOME', '/home/bumblebee/huggingface_cache')
+
+import torch
+from langchain_huggingface import ChatHuggingFace, HuggingFacePipeline
+from transformers import AutoModelForCausalLM, AutoTokenizer, pipeline
+
+MODEL_ID = "HuggingFaceH4/zephyr-7b-beta"  # Smaller & optimized model
+
+
+@lru_cache(maxsize=None)
+def load_model(model_id=MODEL_ID, quantization="int8"):
+    """Load tokenizer + model once and quantize the weights for CPU inference."""
+    tokenizer = AutoTokenizer.from_pretrained(model_id)
+    if tokenizer.pad_token is None:
+        tokenizer.pad_token = tokenizer.eos_token
+    # Decoder-only models must be left-padded so every row ends at the prompt
+    tokenizer.padding_side = "left"
+
+    model = AutoModelForCausalLM.from_pretrained(
+        model_id, torch_dtype=torch.float32, low_cpu_mem_usage=True
+    )
+
+    if quantization == "int8":
+        # inplace=True: the default deep-copies the fp32 model, doubling peak memory
+        model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+    elif quantization == "int4":
+        # pip install optimum-quanto
+        from optimum.quanto import freeze, qint4, quantize
+
+        quantize(model, weights=qint4)
+        freeze(model)
+    elif quantization is not None:
+        raise ValueError(f"Unknown quantization {quantization!r}, use 'int8', 'int4' or None")
+
+    model.eval()
+    return tokenizer, model
+
+
+def _chat_text(tokenizer, prompt):
+    return tokenizer.apply_chat_template(
+        [{"role": "user", "content": prompt}], tokenize=False, add_generation_prompt=True
+    )
+
+
+def generate_batch(prompts, model_id=MODEL_ID, quantization="int8", batch_size=8,
+                   max_new_tokens=100, temperature=0.5):
+    """Generate answers for many prompts, returned in the original order."""
+    tokenizer, model = load_model(model_id, quantization)
+    texts = [_chat_text(tokenizer, prompt) for prompt in prompts]
+
+    # Sort by prompt length so each batch pads to a similar size
+    lengths = [len(ids) for ids in tokenizer(texts, add_special_tokens=False)["input_ids"]]
+    order = sorted(range(len(texts)), key=lengths.__getitem__)
+
+    outputs = [None] * len(texts)
+    for start in range(0, len(order), batch_size):
+        idx = order[start:start + batch_size]
+        encoded = tokenizer(
+            [texts[i] for i in idx], return_tensors="pt", padding=True, add_special_tokens=False
+        )
+        with torch.inference_mode():
+            generated = model.generate(
+                **encoded,
+                max_new_tokens=max_new_tokens,
+                do_sample=temperature > 0,
+                temperature=temperature if temperature > 0 else None,
+                pad_token_id=tokenizer.pad_token_id,
+            )
+        new_tokens = generated[:, encoded["input_ids"].shape[1]:]
+        for i, tokens in zip(idx, new_tokens):
+            outputs[i] = tokenizer.decode(tokens, skip_special_tokens=True).strip()
+    return outputs
+
+
+def get_chat_model(model_id=MODEL_ID, quantization="int8", max_new_tokens=100, temperature=0.5):
+    """ChatHuggingFace over the cached quantized model, for use in chains."""
+    tokenizer, model = load_model(model_id, quantization)
+    pipe = pipeline(
+        "text-generation",
+        model=model,
+        tokenizer=tokenizer,
+        max_new_tokens=max_new_tokens,
+        temperature=temperature,
+        do_sample=temperature > 0,
+        return_full_text=False,
+    )
+    return ChatHuggingFace(llm=HuggingFacePipeline(pipeline=pipe, model_id=model_id))
+
+
+if __name__ == "__main__":
+    # Step 1: Single question through the usual ChatHuggingFace interface
+    model = get_chat_model()
+    result = model.invoke("What is the capital of India?")
+    print(result.content)
+
+    # Step 2: Many questions in padding-aware batches (reuses the loaded model)
+    questions = [
+        "What is the capital of India?",
+        "Name three primary colors.",
+        "Explain photosynthesis in one sentence.",
+        "Who wrote Hamlet?",
+    ]
+    for question, answer in zip(questions, generate_batch(questions, batch_size=4)):
+        print(f"\nQ: {question}\nA: {answer}")
@@ -0,0 +1,124 @@
+"""
+Local Model Benchmark
+Compares the current HuggingFaceLocal.py path (full precision, one invoke per
+prompt) with HuggingFaceLocal_Quantized.py (int8/int4 weights, batched).
+Each mode runs in its own subprocess so load time and peak RSS are measured
+from a clean start.
+
+Usage:
+  python benchmark_local_model.py --model-id HuggingFaceH4/zephyr-7b-beta --prompts 16
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+PROMPTS = [
+    "What is the capital of India?",
+    "Name three primary colors.",
+    "Explain photosynthesis in one sentence.",
+    "Who wrote Hamlet?",
+    "What is the boiling point of water in Celsius?",
+    "Give one tip for writing clean Python code.",
+    "What does CPU stand for?",
+    "Describe the game of cricket in one sentence.",
+]
+
+
+def peak_rss_mb():
+    # ru_maxrss is reported in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_baseline(model_id, prompts, max_new_tokens):
+    from langchain_huggingface import ChatHuggingFace, HuggingFacePipeline
+
+    start = time.perf_counter()
+    llm = HuggingFacePipeline.from_model_id(
+        model_id=model_id,
+        task='text-generation',
+        pipeline_kwargs=dict(temperature=0.5, max_new_tokens=max_new_tokens, return_full_text=False),
+    )
+    model = ChatHuggingFace(llm=llm)
+    load_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    answers = [model.invoke(prompt).content for prompt in prompts]
+    gen_time = time.perf_counter() - start
+    tokens = sum(len(model.tokenizer(answer, add_special_tokens=False)["input_ids"]) for answer in answers)
+    return load_time, gen_time, tokens
+
+
+def run_quantized(model_id, prompts, max_new_tokens, quantization, batch_size):
+    from HuggingFaceLocal_Quantized import generate_batch, load_model
+
+    start = time.perf_counter()
+    tokenizer, _ = load_model(model_id, quantization)
+    load_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    answers = generate_batch(prompts, model_id, quantization, batch_size=batch_size,
+                             max_new_tokens=max_new_tokens)
+    gen_time = time.perf_counter() - start
+    tokens = sum(len(tokenizer(answer, add_special_tokens=False)["input_ids"]) for answer in answers)
+    return load_time, gen_time, tokens
+
+
+def run_mode(args):
+    """Runs inside the subprocess and prints one JSON line."""
+    prompts = (PROMPTS * (args.prompts // len(PROMPTS) + 1))[:args.prompts]
+    if args.mode == "baseline":
+        load_time, gen_time, tokens = run_baseline(args.model_id, prompts, args.max_new_tokens)
+    else:
+        load_time, gen_time, tokens = run_quantized(
+            args.model_id, prompts, args.max_new_tokens, args.mode, args.batch_size
+        )
+    print(json.dumps({
+        "mode": args.mode,
+        "load_time_s": round(load_time, 2),
+        "generate_time_s": round(gen_time, 2),
+        "generated_tokens": tokens,
+        "tokens_per_sec": round(tokens / gen_time, 2) if gen_time else None,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model-id", default="HuggingFaceH4/zephyr-7b-beta")
+    parser.add_argument("--prompts", type=int, default=8)
+    parser.add_argument("--max-new-tokens", type=int, default=64)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--modes", default="baseline,int8,int4")
+    parser.add_argument("--mode", help=argparse.SUPPRESS)  # set when running as a child
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args)
+        return
+
+    results = []
+    for mode in args.modes.split(","):
+        child = subprocess.run(
+            [sys.executable, __file__, "--mode", mode, "--model-id", args.model_id,
+             "--prompts", str(args.prompts), "--max-new-tokens", str(args.max_new_tokens),
+             "--batch-size", str(args.batch_size)],
+            capture_output=True, text=True,
+        )
+        if child.returncode != 0:
+            print(f"{mode}: failed\n{child.stderr.strip().splitlines()[-1] if child.stderr else ''}")
+            continue
+        results.append(json.loads(child.stdout.strip().splitlines()[-1]))
+
+    print(f"\n{'mode':<10}{'load (s)':>10}{'gen (s)':>10}{'tok/s':>10}{'RSS (MB)':>12}")
+    print("-" * 52)
+    for r in results:
+        print(f"{r['mode']:<10}{r['load_time_s']:>10}{r['generate_time_s']:>10}"
+              f"{r['tokens_per_sec']:>10}{r['peak_rss_mb']:>12}")
+
+
+if __name__ == "__main__":
+    main()
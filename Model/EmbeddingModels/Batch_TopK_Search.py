@@ -0,0 +1,111 @@
+"""
+Batch Top-K Similarity Search Example
+Scores many queries against a large, memory-mapped document matrix at once.
+Documents are L2-normalized a single time when the index is built, so cosine
+similarity becomes a plain matrix multiply, and np.argpartition picks the top-k
+in O(n) instead of sorting every score.
+"""
+
+import numpy as np
+from dotenv import load_dotenv
+from langchain_huggingface import HuggingFaceEndpointEmbeddings
+
+
+def _normalize(matrix):
+    """L2-normalize each row (zero rows are left as zeros)."""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def build_index(vector_batches, path, num_docs, dim):
+    """Write normalized document vectors to a .npy file, one batch at a time."""
+    index = np.lib.format.open_memmap(path, mode="w+", dtype=np.float32, shape=(num_docs, dim))
+    row = 0
+    for batch in vector_batches:
+        batch = _normalize(batch)
+        index[row:row + len(batch)] = batch
+        row += len(batch)
+    if row != num_docs:
+        raise ValueError(f"Expected {num_docs} vectors, got {row}")
+    index.flush()
+    return path
+
+
+class TopKSearcher:
+    """Top-k cosine search over a memory-mapped, pre-normalized embedding file."""
+
+    def __init__(self, path, block_size=65_536):
+        # mmap_mode="r" keeps the matrix on disk; pages are read as blocks are scored
+        self.docs = np.load(path, mmap_mode="r")
+        self.block_size = block_size
+
+    def search(self, query_vectors, k=5):
+        """Return (indices, scores), each of shape (num_queries, k), best first."""
+        queries = _normalize(np.atleast_2d(query_vectors))
+        num_queries = len(queries)
+        k = min(k, len(self.docs))
+
+        best_idx = np.empty((num_queries, 0), dtype=np.int64)
+        best_score = np.empty((num_queries, 0), dtype=np.float32)
+        rows = np.arange(num_queries)[:, None]
+
+        # Memory stays at num_queries x (block_size + k) however large the corpus is
+        for start in range(0, len(self.docs), self.block_size):
+            block = np.asarray(self.docs[start:start + self.block_size])
+            scores = queries @ block.T
+
+            # Merge this block's scores with the running top-k, then keep k again
+            scores = np.concatenate([best_score, scores], axis=1)
+            idx = np.concatenate(
+                [best_idx, np.broadcast_to(np.arange(start, start + len(block)), (num_queries, len(block)))],
+                axis=1,
+            )
+            if scores.shape[1] > k:
+                top = np.argpartition(scores, -k, axis=1)[:, -k:]
+                scores, idx = scores[rows, top], idx[rows, top]
+            best_score, best_idx = scores, idx
+
+        # Only the final k per query need an actual sort
+        order = np.argsort(-best_score, axis=1)
+        return best_idx[rows, order], best_score[rows, order]
+
+
+if __name__ == "__main__":
+    load_dotenv()
+
+    embedding = HuggingFaceEndpointEmbeddings(
+        model="sentence-transformers/all-MiniLM-L6-v2",
+    )
+
+    documents = [
+        "Python is a popular programming language used for data science, machine learning, and web development.",
+        "Machine learning is a subset of artificial intelligence that focuses on training algorithms to make predictions.",
+        "LangChain is a powerful framework for building LLM-based applications with memory, tools, and agents.",
+        "Hugging Face provides state-of-the-art machine learning models and APIs for natural language processing.",
+        "Streamlit is an open-source framework that helps you create interactive data apps using Python."
+    ]
+
+    queries = [
+        "Explain what Hugging Face does",
+        "Which tool builds data apps in Python?",
+    ]
+
+    # Step 1: Embed documents in batches and write the normalized index to disk
+    batch_size = 2
+    batches = (
+        embedding.embed_documents(documents[i:i + batch_size])
+        for i in range(0, len(documents), batch_size)
+    )
+    dim = len(embedding.embed_query("dimension probe"))
+    build_index(batches, "doc_embeddings.npy", num_docs=len(documents), dim=dim)
+
+    # Step 2: Score every query in one matrix multiply per block
+    searcher = TopKSearcher("doc_embeddings.npy")
+    indices, scores = searcher.search(embedding.embed_documents(queries), k=2)
+
+    for query, idx_row, score_row in zip(queries, indices, scores):
+        print(f"\nQuery: {query}")
+        for index, score in zip(idx_row, score_row):
+            print(f"  {score:.4f}  {documents[index]}")
@@ -0,0 +1,214 @@
+"""
+Persistent Embedding Cache Example
+Wraps HuggingFaceEmbeddings so every vector is stored on disk, keyed by a hash
+of the model name and the text. Re-indexing the same corpus only sends the
+texts that were never embedded before to the model.
+
+Layout of the cache directory:
+  index.sqlite  -> key -> row in the matrix, plus last-used time (for eviction),
+                   and the matrix shape (max_entries, dim) in the meta table
+  vectors.f32   -> memory-mapped float32 matrix of shape (max_entries, dim)
+
+Reopening the directory with a different max_entries compacts the matrix into
+the new size, keeping the most recently used vectors. The vector size is fixed
+per directory: use a separate cache_dir for a model with a different dimension.
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+from langchain_huggingface import HuggingFaceEmbeddings
+
+# SQLite refuses more than 999 "?" parameters in one statement on older builds
+SQL_CHUNK = 500
+
+
+class CachedEmbeddings(Embeddings):
+    """Content-addressed, size-bounded disk cache in front of an embedding model."""
+
+    def __init__(self, embeddings, model_name, cache_dir="embedding_cache", max_entries=100_000):
+        self.embeddings = embeddings
+        self.model_name = model_name
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self.db = sqlite3.connect(os.path.join(cache_dir, "index.sqlite"))
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS vectors ("
+            "key TEXT PRIMARY KEY, slot INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON vectors(last_used)")
+        self.db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+        self.db.commit()
+
+        self.matrix = None
+        meta = dict(self.db.execute("SELECT name, value FROM meta").fetchall())
+        if "dim" in meta:
+            dim = int(meta["dim"])
+            path = os.path.join(self.cache_dir, "vectors.f32")
+            # Caches written before max_entries was recorded: the file size gives it
+            capacity = int(meta.get("max_entries", os.path.getsize(path) // (4 * dim)))
+            if capacity != self.max_entries:
+                self._resize(capacity, dim)
+            self._open_matrix(dim)
+
+    # ------------------ Storage helpers ------------------
+    def _open_matrix(self, dim):
+        """Open (or create) the memory-mapped vector matrix."""
+        path = os.path.join(self.cache_dir, "vectors.f32")
+        mode = "r+" if os.path.exists(path) else "w+"
+        self.matrix = np.memmap(path, dtype=np.float32, mode=mode, shape=(self.max_entries, dim))
+        self.db.executemany("INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                            [("dim", str(dim)), ("max_entries", str(self.max_entries))])
+        self.db.commit()
+
+    def _resize(self, capacity, dim):
+        """Copy the most recently used vectors of a (capacity, dim) matrix into a (max_entries, dim) one."""
+        path = os.path.join(self.cache_dir, "vectors.f32")
+        old = np.memmap(path, dtype=np.float32, mode="r", shape=(capacity, dim))
+        rows = self.db.execute(
+            "SELECT key, slot, last_used FROM vectors ORDER BY last_used DESC LIMIT ?", (self.max_entries,)
+        ).fetchall()
+        new = np.memmap(path + ".tmp", dtype=np.float32, mode="w+", shape=(self.max_entries, dim))
+        for i, (_, slot, _) in enumerate(rows):
+            new[i] = old[slot]
+        new.flush()
+        del old, new
+        os.replace(path + ".tmp", path)
+        self.db.execute("DELETE FROM vectors")
+        self.db.executemany("INSERT INTO vectors VALUES (?, ?, ?)",
+                            [(key, i, last_used) for i, (key, _, last_used) in enumerate(rows)])
+        self.db.commit()
+
+    def _key(self, text, kind):
+        """Hash the model name, call type and text into a cache key."""
+        payload = f"{self.model_name}\0{kind}\0{text}".encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def _lookup(self, keys):
+        """Return {key: slot} for every key already in the cache."""
+        found = {}
+        for i in range(0, len(keys), SQL_CHUNK):
+            chunk = keys[i:i + SQL_CHUNK]
+            marks = ",".join("?" * len(chunk))
+            rows = self.db.execute(f"SELECT key, slot FROM vectors WHERE key IN ({marks})", chunk)
+            found.update(rows.fetchall())
+        return found
+
+    def _allocate(self, count):
+        """Return `count` free slots, evicting least recently used keys if full."""
+        used = self.db.execute("SELECT COUNT(*) FROM vectors").fetchone()[0]
+        free = min(count, self.max_entries - used)
+        # Slots stay contiguous (0..used-1) because we only evict when full
+        slots = list(range(used, used + free))
+        if len(slots) < count:
+            victims = self.db.execute(
+                "SELECT key, slot FROM vectors ORDER BY last_used LIMIT ?",
+                (count - len(slots),),
+            ).fetchall()
+            self.db.executemany("DELETE FROM vectors WHERE key = ?", [(k,) for k, _ in victims])
+            slots.extend(slot for _, slot in victims)
+        return slots
+
+    # ------------------ Core lookup ------------------
+    def _embed(self, texts, kind, compute):
+        keys = [self._key(text, kind) for text in texts]
+        found = self._lookup(list(set(keys))) if self.matrix is not None else {}
+
+        # Copy hits out of the matrix before any slot can be reused below
+        vectors = {key: np.array(self.matrix[slot]) for key, slot in found.items()}
+
+        # Deduplicate misses so repeated texts in one batch are embedded once
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key in found:
+                self.hits += 1
+            else:
+                self.misses += 1
+                missing.setdefault(key, text)
+
+        now = time.time()
+        self.db.executemany(
+            "UPDATE vectors SET last_used = ? WHERE key = ?", [(now, key) for key in found]
+        )
+
+        if missing:
+            computed = np.asarray(compute(list(missing.values())), dtype=np.float32)
+            if self.matrix is None:
+                self._open_matrix(computed.shape[1])
+            elif computed.shape[1] != self.matrix.shape[1]:
+                raise ValueError(
+                    f"{self.model_name} returns {computed.shape[1]}-d vectors but the cache in "
+                    f"{self.cache_dir!r} holds {self.matrix.shape[1]}-d ones; use a separate cache_dir per model"
+                )
+            vectors.update(zip(missing, computed))
+
+            # A batch larger than the whole cache can only keep its tail
+            to_store = list(missing)[-self.max_entries:]
+            slots = self._allocate(len(to_store))
+            for key, slot in zip(to_store, slots):
+                self.matrix[slot] = vectors[key]
+            self.db.executemany(
+                "INSERT OR REPLACE INTO vectors VALUES (?, ?, ?)",
+                [(key, slot, now) for key, slot in zip(to_store, slots)],
+            )
+            self.matrix.flush()
+        self.db.commit()
+
+        return [vectors[key].tolist() for key in keys]
+
+    # ------------------ Embeddings interface ------------------
+    def embed_documents(self, texts):
+        return self._embed(texts, "document", self.embeddings.embed_documents)
+
+    def embed_query(self, text):
+        return self._embed([text], "query", lambda batch: [self.embeddings.embed_query(batch[0])])[0]
+
+    def stats(self):
+        """Return hit/miss counters and the current cache size."""
+        size = self.db.execute("SELECT COUNT(*) FROM vectors").fetchone()[0]
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": size,
+            "max_entries": self.max_entries,
+        }
+
+
+if __name__ == "__main__":
+    MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
+    # Step 1: Wrap the local embedding model with the disk cache
+    embedding = CachedEmbeddings(
+        HuggingFaceEmbeddings(model_name=MODEL_NAME),
+        model_name=MODEL_NAME,
+        cache_dir="embedding_cache",
+        max_entries=10_000,
+    )
+
+    documents = [
+        "Machine learning is a subset of artificial intelligence focused on building systems that learn from data.",
+        "The Eiffel Tower in Paris attracts millions of tourists every year and is one of the most visited landmarks in the world.",
+        "The human heart pumps blood throughout the body, supplying oxygen and nutrients to various organs."
+    ]
+
+    # Step 2: First call embeds everything that is not on disk yet
+    start = time.perf_counter()
+    embedding.embed_documents(documents)
+    print(f"First pass:  {time.perf_counter() - start:.3f}s  {embedding.stats()}")
+
+    # Step 3: Second call is served entirely from the cache
+    start = time.perf_counter()
+    vector = embedding.embed_documents(documents)
+    print(f"Second pass: {time.perf_counter() - start:.3f}s  {embedding.stats()}")
+
+    print(f"\nEmbedding Vector (first 10 dims): {vector[0][:10]}")
@@ -0,0 +1,181 @@
+"""
+Streaming Pydantic Parser Example
+PydanticOutputParser in Pydantic_Output_Parser.py only sees the answer after the
+last token, so a wrong answer is only caught after paying for all of it. This
+parser consumes model.stream(...) chunk by chunk and:
+  - re-parses the partial JSON after every chunk
+  - validates each field as soon as it is complete (the next key has started,
+    or the object has closed) against that field's type and constraints
+  - yields the validated fields so far as a dict whenever a new field completes,
+    and finally the full Pydantic object
+  - aborts as soon as the output can no longer match the schema (an unknown key
+    or a field failing validation): it closes the model stream, which stops
+    generation, and raises OutputParserException
+  - stops reading (and closes the stream) once the object is closed; any text the
+    model adds after it, like "Hope this helps!", is ignored
+"""
+
+import json
+from typing import Annotated
+
+from langchain_core.exceptions import OutputParserException
+from langchain_core.utils.json import parse_json_markdown, parse_partial_json
+from pydantic import TypeAdapter, ValidationError
+
+_decoder = json.JSONDecoder()
+
+
+def _partial(text):
+    try:
+        return parse_partial_json(text)
+    except json.JSONDecodeError:
+        return None
+
+
+def _find_object(text):
+    """(object so far, closed) for the JSON object in `text`, ignoring any text before or after it.
+
+    Decoding is tried from each "{" in turn, so braces in a preamble ("Here {is} the JSON: {...}")
+    are skipped. The first "{" that starts a complete object, or valid but unfinished JSON (the
+    object is still streaming, so a nested object inside it must not count as closed), wins.
+    Returns (None, False) if there is no such "{" yet.
+    """
+    start = text.find("{")
+    while start != -1:
+        try:
+            value = _decoder.raw_decode(text, start)[0]
+            if isinstance(value, dict):
+                return value, True
+        except json.JSONDecodeError:
+            value = _partial(text[start:])
+            if value is not None:
+                return value, False
+        start = text.find("{", start + 1)
+    return None, False
+
+
+class StreamingPydanticParser:
+    """Incrementally parse and validate a streamed JSON object against a Pydantic model."""
+
+    def __init__(self, pydantic_object, allow_extra_keys=False):
+        self.pydantic_object = pydantic_object
+        self.allow_extra_keys = allow_extra_keys
+        self.fields = {}    # JSON key -> field name
+        self.adapters = {}  # JSON key -> TypeAdapter for that field's type + constraints
+        for name, field in pydantic_object.model_fields.items():
+            key = field.alias or name
+            self.fields[key] = name
+            annotation = Annotated[(field.annotation, *field.metadata)] if field.metadata else field.annotation
+            self.adapters[key] = TypeAdapter(annotation)
+        self.chunks_seen = 0
+
+    @staticmethod
+    def _close(stream):
+        close = getattr(stream, "close", None)
+        if close:
+            close()  # stops the generation upstream
+
+    def _abort(self, stream, message, text):
+        self._close(stream)
+        raise OutputParserException(f"{message} (after {self.chunks_seen} chunks)", llm_output=text)
+
+    def _check_key(self, stream, key, text, complete):
+        if self.allow_extra_keys or key in self.fields:
+            return
+        # An unfinished key only fails once it is no longer the start of any field name
+        if complete or not any(name.startswith(key) for name in self.fields):
+            self._abort(stream, f"Unknown key {key!r} for {self.pydantic_object.__name__}", text)
+
+    def parse_stream(self, stream):
+        """Yield dicts of validated fields as they complete, then the final model instance."""
+        text = ""
+        validated = {}
+        self.chunks_seen = 0
+
+        for chunk in stream:
+            text += chunk if isinstance(chunk, str) else chunk.content
+            self.chunks_seen += 1
+            partial, closed = _find_object(text)
+            if partial is None:
+                try:
+                    partial = parse_json_markdown(text, parser=parse_partial_json)
+                except json.JSONDecodeError:
+                    continue
+                if partial is None:
+                    continue
+            if not isinstance(partial, dict):
+                self._abort(stream, f"Expected a JSON object, got {type(partial).__name__}", text)
+
+            keys = list(partial)
+            new_fields = False
+            for i, key in enumerate(keys):
+                complete = closed or i < len(keys) - 1
+                self._check_key(stream, key, text, complete)
+                if not complete or key in validated or key not in self.fields:
+                    continue
+                try:
+                    validated[key] = self.adapters[key].validate_python(partial[key])
+                except ValidationError as e:
+                    self._abort(stream, f"Field {key!r} failed validation: {e.errors()[0]['msg']}", text)
+                new_fields = True
+
+            if new_fields:
+                yield {self.fields[key]: value for key, value in validated.items()}
+            if closed:
+                self._close(stream)  # the rest would only be trailing text
+                break
+
+        # Full validation catches missing required fields and model-level validators
+        data, closed = _find_object(text)
+        if not closed:
+            raise OutputParserException(
+                f"Failed to parse {self.pydantic_object.__name__}: the JSON object was never closed", llm_output=text
+            )
+        try:
+            result = self.pydantic_object.model_validate(data)
+        except ValidationError as e:
+            raise OutputParserException(f"Failed to parse {self.pydantic_object.__name__}: {e}", llm_output=text)
+        yield result
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+    from langchain_core.output_parsers import PydanticOutputParser
+    from langchain_core.prompts import PromptTemplate
+    from langchain_huggingface import ChatHuggingFace, HuggingFaceEndpoint
+    from pydantic import BaseModel, Field
+
+    load_dotenv()
+
+    llm = HuggingFaceEndpoint(
+        repo_id="google/gemma-2-2b-it",
+        task="text-generation",
+        max_new_tokens=256,
+        temperature=0.0
+    )
+
+    model = ChatHuggingFace(llm=llm)
+
+    class Person(BaseModel):
+        name: str = Field(description="Name of the person")
+        age: int = Field(gt=18, description="Age of the person")
+        city: str = Field(description="Name of the city the person belongs to")
+
+    parser = StreamingPydanticParser(Person)
+
+    template = PromptTemplate(
+        template=(
+            "Generate a fictional person's data from {place}.\n"
+            "Return a JSON object strictly matching the schema:\n{format_instruction}\n"
+            "Do not include any text outside the JSON."
+        ),
+        input_variables=['place'],
+        # Format instructions are the same as PydanticOutputParser's
+        partial_variables={'format_instruction': PydanticOutputParser(pydantic_object=Person).get_format_instructions()}
+    )
+
+    try:
+        for update in parser.parse_stream(model.stream(template.invoke({'place': 'Sri Lanka'}))):
+            print(update)
+    except OutputParserException as e:
+        print(f"Aborted early: {e}")
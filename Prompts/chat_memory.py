@@ -0,0 +1,104 @@
+# Token-budgeted rolling conversation memory for chatbot.py.
+#
+# Keeps the last `keep_turns` turns verbatim, folds older turns into a running
+# summary on a background thread, and trims every prompt to `max_tokens`, so the
+# size of each request stays flat no matter how long the session runs.
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+SUMMARY_PROMPT = (
+    "Update the running summary of a conversation.\n"
+    "Keep names, facts, decisions and open questions. Be concise.\n\n"
+    "Current summary:\n{summary}\n\n"
+    "New turns:\n{turns}\n\n"
+    "Updated summary:"
+)
+
+
+def approx_tokens(text):
+    """Cheap token estimate (~4 characters per token for English text)."""
+    return len(text) // 4 + 1
+
+
+class RollingMemory:
+    """Recent turns verbatim + background summary of older turns, under a hard token budget."""
+
+    def __init__(self, model, system_prompt, keep_turns=4, max_tokens=3000,
+                 summary_max_tokens=500, count_tokens=approx_tokens):
+        self.model = model
+        self.system = SystemMessage(content=system_prompt)
+        self.keep_turns = keep_turns
+        self.max_tokens = max_tokens
+        self.summary_max_tokens = summary_max_tokens
+        self.count_tokens = count_tokens
+
+        self.summary = ""
+        self.recent = []    # [(HumanMessage, AIMessage), ...] kept verbatim
+        self.pending = []   # turns waiting to be folded into the summary
+        self._lock = threading.Lock()
+        # One worker so summaries are applied in order
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def add_turn(self, user_input, ai_output):
+        """Record a finished turn; older turns are compacted in the background."""
+        with self._lock:
+            self.recent.append((HumanMessage(content=user_input), AIMessage(content=ai_output)))
+            overflow = len(self.recent) - self.keep_turns
+            if overflow <= 0:
+                return
+            self.pending.extend(self.recent[:overflow])
+            self.recent = self.recent[overflow:]
+        self._executor.submit(self._compact)
+
+    def _compact(self):
+        with self._lock:
+            turns, summary = list(self.pending), self.summary
+        if not turns:
+            return
+        text = "\n".join(f"User: {h.content}\nAI: {a.content}" for h, a in turns)
+        result = self.model.invoke(SUMMARY_PROMPT.format(summary=summary or "(empty)", turns=text))
+        with self._lock:
+            self.summary = self._truncate(result.content, self.summary_max_tokens)
+            # Only drop the turns that made it into this summary
+            self.pending = self.pending[len(turns):]
+
+    def _truncate(self, text, budget):
+        """Cut `text` down to roughly `budget` tokens, keeping the end."""
+        while text and self.count_tokens(text) > budget:
+            text = text[len(text) // 10 + 1:]
+        return text
+
+    def messages(self, user_input):
+        """Build the message list for the next call, within `max_tokens`."""
+        with self._lock:
+            summary = self.summary
+            # Turns still waiting for the summarizer are sent verbatim so nothing is lost
+            turns = self.pending + self.recent
+
+        question = HumanMessage(content=user_input)
+        budget = self.max_tokens - self.count_tokens(self.system.content) - self.count_tokens(user_input)
+
+        # Newest turns first, until the budget runs out
+        kept = []
+        for human, ai in reversed(turns):
+            cost = self.count_tokens(human.content) + self.count_tokens(ai.content)
+            if cost > budget:
+                break
+            kept.append((human, ai))
+            budget -= cost
+
+        history = []
+        if summary and budget > 0:
+            summary = self._truncate(summary, budget)
+            if summary:
+                history.append(SystemMessage(content=f"Summary of the earlier conversation:\n{summary}"))
+        for human, ai in reversed(kept):
+            history.extend([human, ai])
+
+        return [self.system, *history, question]
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
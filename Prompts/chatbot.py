@@ -1,10 +1,11 @@
 # LIST OF MESSAGES -> STATIC MESSAGE (SystemMessage, HumanMessage, AIMessage)
 
 from langchain_huggingface import ChatHuggingFace, HuggingFaceEndpoint
-from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
 
 from langchain_core.prompts import PromptTemplate
 from dotenv import load_dotenv
+from stream_metrics import StreamMetrics, stream_text
+from chat_memory import RollingMemory
 import streamlit as st
 import os
 
@@ -17,16 +18,36 @@ llm = HuggingFaceEndpoint(
 )
 model = ChatHuggingFace(llm=llm)
 
-chat_history = [
-    SystemMessage(content = 'You are a helpful AI Agent')
-    
-]
+# Last 4 turns verbatim, older turns summarized, every prompt capped at ~3000 tokens
+memory = RollingMemory(
+    model,
+    system_prompt = 'You are a helpful AI Agent',
+    keep_turns = 4,
+    max_tokens = 3000
+)
+
+# Session totals, for the mean TTFT printed on exit
+ttft_total = 0.0
+ttft_count = 0
 
 while True:
     user_input = input('You : ')
-    chat_history.append(HumanMessage(content = user_input))
     if user_input == 'exit':
         break
-    result = model.invoke(chat_history)
-    chat_history.append(AIMessage(content = result.content))
-    print("Ai : ", result.content)
\ No newline at end of file
+    chat_history = memory.messages(user_input)
+    # Stream tokens to the terminal as they arrive instead of waiting for the full answer
+    metrics = StreamMetrics()
+    print("Ai : ", end="", flush=True)
+    parts = []
+    for text in stream_text(model.stream(chat_history), metrics):
+        print(text, end="", flush=True)
+        parts.append(text)
+    print(f"\n[{metrics.summary()}]")
+    if metrics.ttft is not None:
+        ttft_total += metrics.ttft
+        ttft_count += 1
+    memory.add_turn(user_input, "".join(parts))
+
+memory.close()
+if ttft_count:
+    print(f"Mean TTFT over {ttft_count} responses: {ttft_total / ttft_count:.2f}s")
@@ -1,6 +1,7 @@
 from langchain_huggingface import ChatHuggingFace, HuggingFaceEndpoint
 from langchain_core.prompts import PromptTemplate
 from dotenv import load_dotenv
+from stream_metrics import StreamMetrics, stream_text
 import streamlit as st
 import os
 
@@ -58,11 +59,16 @@ if st.button("Summarize"):
         style=style_input,
     )
 
-    # Directly call the model with the formatted prompt
-    response = model.invoke(final_prompt)
-
+    # Stream the answer so the first words show up as soon as they are generated
     st.subheader("Generated Summary")
-    st.write(response.content)
+    metrics = StreamMetrics()
+    st.write_stream(stream_text(model.stream(final_prompt), metrics))
+
+    # Keep per-request latency metrics for this browser session
+    st.session_state.setdefault("metrics_log", []).append(
+        {"ttft": metrics.ttft, "tokens_per_sec": metrics.tokens_per_sec, "tokens": metrics.tokens}
+    )
+    st.caption(metrics.summary())
 
 """
     1️⃣ Create a JSON Template File
@@ -0,0 +1,52 @@
+# Helpers to stream model output while recording latency metrics.
+# Used by chatbot.py (terminal) and prompt_ui.py (Streamlit).
+
+import time
+
+
+class StreamMetrics:
+    """Time-to-first-token and throughput for one streamed response."""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.first_token_at = None
+        self.end = None
+        self.tokens = 0
+        self.reported_tokens = None  # output_tokens from usage_metadata, if the server sends it
+
+    @property
+    def ttft(self):
+        """Seconds until the first token arrived."""
+        return None if self.first_token_at is None else self.first_token_at - self.start
+
+    @property
+    def tokens_per_sec(self):
+        """Tokens generated per second after the first token."""
+        tokens = self.reported_tokens or self.tokens
+        if self.first_token_at is None or self.end is None or self.end <= self.first_token_at:
+            return None
+        return (tokens - 1) / (self.end - self.first_token_at) if tokens > 1 else None
+
+    def summary(self):
+        ttft = f"{self.ttft:.2f}s" if self.ttft is not None else "n/a"
+        rate = f"{self.tokens_per_sec:.1f} tok/s" if self.tokens_per_sec is not None else "n/a"
+        return f"TTFT {ttft} | {rate} | {self.reported_tokens or self.tokens} tokens"
+
+
+def stream_text(chunks, metrics):
+    """Yield the text of each streamed chunk, updating `metrics` as they arrive.
+
+    Each non-empty chunk is counted as one token, which matches how the HF
+    endpoints stream; usage_metadata wins when the server reports it.
+    """
+    for chunk in chunks:
+        usage = getattr(chunk, "usage_metadata", None)
+        if usage:
+            metrics.reported_tokens = usage.get("output_tokens") or metrics.reported_tokens
+        if not chunk.content:
+            continue
+        if metrics.first_token_at is None:
+            metrics.first_token_at = time.perf_counter()
+        metrics.tokens += 1
+        yield chunk.content
+    metrics.end = time.perf_counter()
@@ -0,0 +1,166 @@
+"""
+Cached Wikipedia Retriever Example
+Wikipedia_Retriver.py hits the network on every query and downloads the
+pages one after another. This retriever talks to the MediaWiki API directly and:
+  - stores search results and page bodies on disk, with a TTL
+  - fetches the top_k pages concurrently
+  - can run fully offline, serving only what is already in the cache
+  - takes an `api_url`, so it can be pointed at wikipedia_stub_server.py
+
+Usage:
+  python Cached_Wikipedia_Retriver.py            # real Wikipedia
+  python Cached_Wikipedia_Retriver.py --stub     # local stub server, no network
+"""
+
+import hashlib
+import json
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlencode
+
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+
+USER_AGENT = "GenAi-Learning/1.0 (cached wikipedia retriever example)"
+
+
+class DiskCache:
+    """One JSON file per URL, holding the response and when it was fetched."""
+
+    def __init__(self, directory, ttl_seconds):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+
+    def _path(self, key):
+        return self.directory / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, key, allow_stale=False):
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if not allow_stale and time.time() - entry["fetched_at"] > self.ttl_seconds:
+            return None
+        return entry["body"]
+
+    def set(self, key, body):
+        path = self._path(key)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"fetched_at": time.time(), "body": body}), encoding="utf-8")
+        tmp.replace(path)  # atomic, so concurrent readers never see half a file
+
+
+class CachedWikipediaRetriever(BaseRetriever):
+    """Wikipedia retriever with an on-disk TTL cache and concurrent page fetching."""
+
+    top_k_results: int = 2
+    lang: str = "en"
+    api_url: str | None = None  # defaults to https://{lang}.wikipedia.org/w/api.php
+    cache_dir: str = "wikipedia_cache"
+    ttl_seconds: float = 7 * 24 * 3600
+    offline: bool = False
+    doc_content_chars_max: int = 4000
+    timeout: float = 10.0
+    max_workers: int = 8
+
+    @property
+    def _api(self):
+        return self.api_url or f"https://{self.lang}.wikipedia.org/w/api.php"
+
+    def _get_json(self, cache, params):
+        """GET the API with caching; stale entries are used when offline or on network errors."""
+        url = f"{self._api}?{urlencode(sorted(params.items()))}"
+        cached = cache.get(url)
+        if cached is not None:
+            return cached
+        if self.offline:
+            return cache.get(url, allow_stale=True)
+
+        request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                body = json.loads(response.read().decode("utf-8"))
+        except (urllib.error.URLError, TimeoutError):
+            return cache.get(url, allow_stale=True)
+        cache.set(url, body)
+        return body
+
+    def _search(self, cache, query):
+        body = self._get_json(cache, {
+            "action": "query", "list": "search", "srsearch": query,
+            "srlimit": self.top_k_results, "format": "json",
+        })
+        if not body:
+            return []
+        return [hit["title"] for hit in body.get("query", {}).get("search", [])]
+
+    def _page(self, cache, title):
+        body = self._get_json(cache, {
+            "action": "query", "prop": "extracts|info", "explaintext": 1, "inprop": "url",
+            "redirects": 1, "titles": title, "format": "json",
+        })
+        if not body:
+            return None
+        for page in body.get("query", {}).get("pages", {}).values():
+            if "missing" in page or not page.get("extract"):
+                continue
+            text = page["extract"]
+            return Document(
+                page_content=text[:self.doc_content_chars_max],
+                metadata={
+                    "title": page["title"],
+                    "summary": text.split("\n", 1)[0],
+                    "source": page.get("fullurl", ""),
+                },
+            )
+        return None
+
+    def _get_relevant_documents(self, query, *, run_manager=None):
+        cache = DiskCache(self.cache_dir, self.ttl_seconds)
+        titles = self._search(cache, query)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(titles) or 1)) as pool:
+            pages = list(pool.map(lambda title: self._page(cache, title), titles))
+        return [page for page in pages if page is not None]
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stub", action="store_true", help="use the local stub server instead of Wikipedia")
+    args = parser.parse_args()
+
+    api_url = None
+    if args.stub:
+        from wikipedia_stub_server import start_stub_server
+        server, api_url = start_stub_server(delay=0.2)
+
+    retriever = CachedWikipediaRetriever(top_k_results=2, lang="en", api_url=api_url)
+    query = "artificial intelligence and machine learning applications"
+
+    # Step 1: First call goes to the API, pages are fetched concurrently
+    start = time.perf_counter()
+    docs = retriever.invoke(query)
+    print(f"First call:  {time.perf_counter() - start:.2f}s")
+
+    # Step 2: Second call is served from the disk cache
+    start = time.perf_counter()
+    docs = retriever.invoke(query)
+    print(f"Second call: {time.perf_counter() - start:.2f}s")
+
+    # Step 3: Offline mode never touches the network
+    offline_docs = CachedWikipediaRetriever(top_k_results=2, api_url=api_url, offline=True).invoke(query)
+    print(f"Offline:     {len(offline_docs)} documents from cache")
+
+    print(f"\nFound {len(docs)} Wikipedia articles:\n")
+    for i, doc in enumerate(docs):
+        print(f"\n{'='*80}")
+        print(f"Article {i+1}: {doc.metadata.get('title', 'Unknown')}")
+        print(f"{'='*80}")
+        print(f"{doc.page_content[:500]}...")
+        print(f"\nSource: {doc.metadata.get('source', 'N/A')}")
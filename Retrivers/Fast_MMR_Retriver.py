@@ -0,0 +1,145 @@
+"""
+Fast MMR (Maximal Marginal Relevance) Retriever Example
+Same behaviour as search_type="mmr" in MMR_Retriver.py, but the selection is
+incremental and vectorized:
+  - query/candidate relevance is computed once for the whole candidate block
+  - after each pick, a running "max similarity to anything selected" vector is
+    updated with one matrix-vector product, instead of recomputing the
+    similarity to every selected document
+  - many queries are handled at once: FAISS searches them in one call and MMR
+    runs on a (queries x fetch_k) block
+
+Selection costs O(k * fetch_k) vector operations per query.
+See benchmark_mmr.py for timings at fetch_k = 20 / 200 / 2000.
+"""
+
+import numpy as np
+from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+from langchain_huggingface import HuggingFaceEmbeddings
+
+from retriever_utils import embed_queries, unit_rows
+
+
+def mmr_select(query_vectors, candidate_vectors, k=4, lambda_mult=0.5):
+    """Pick `k` candidates per query by MMR.
+
+    query_vectors:     (d,) or (B, d)
+    candidate_vectors: (F, d) shared by all queries, or (B, F, d)
+    Returns an int array of shape (B, k) (or (k,) for a single query).
+    """
+    single = np.ndim(query_vectors) == 1
+    queries = unit_rows(np.atleast_2d(query_vectors))
+    candidates = unit_rows(candidate_vectors)
+    if candidates.ndim == 2:
+        candidates = np.broadcast_to(candidates, (len(queries), *candidates.shape))
+
+    batch, fetch_k, _ = candidates.shape
+    k = min(k, fetch_k)
+    rows = np.arange(batch)
+
+    relevance = np.einsum("bfd,bd->bf", candidates, queries)
+    max_sim = np.full((batch, fetch_k), -np.inf, dtype=np.float32)
+    selected = np.empty((batch, k), dtype=np.int64)
+    taken = np.zeros((batch, fetch_k), dtype=bool)
+
+    # The first pick is always the most relevant candidate
+    pick = np.argmax(relevance, axis=1)
+    for step in range(k):
+        if step > 0:
+            score = lambda_mult * relevance - (1 - lambda_mult) * max_sim
+            score[taken] = -np.inf
+            pick = np.argmax(score, axis=1)
+        selected[:, step] = pick
+        taken[rows, pick] = True
+        # Only the newest pick can raise anyone's max similarity
+        sims = np.einsum("bfd,bd->bf", candidates, candidates[rows, pick])
+        np.maximum(max_sim, sims, out=max_sim)
+
+    return selected[0] if single else selected
+
+
+def _reconstruct(index, ids):
+    try:
+        return index.reconstruct_batch(ids)
+    except RuntimeError as e:
+        raise ValueError(
+            f"{type(index).__name__} cannot return stored vectors, which MMR needs; use a flat or HNSW "
+            "index, or call faiss.extract_index_ivf(index).make_direct_map() on an IVF index"
+        ) from e
+
+
+def mmr_search(vectorstore, query_vectors, k=4, fetch_k=20, lambda_mult=0.5):
+    """Batched MMR over a FAISS store: one index search, one MMR pass."""
+    queries = np.atleast_2d(np.asarray(query_vectors, dtype=np.float32))
+    fetch_k = min(fetch_k, vectorstore.index.ntotal)
+    index = vectorstore.index
+
+    _, ids = index.search(queries, fetch_k)
+    if (ids >= 0).all():
+        candidates = _reconstruct(index, ids.ravel()).reshape(len(queries), fetch_k, -1)
+        picks = mmr_select(queries, candidates, k=k, lambda_mult=lambda_mult)
+        id_rows = list(ids)
+    else:
+        # Approximate indexes (HNSW, IVF) can return fewer than fetch_k hits, padded with -1
+        id_rows = [row[row >= 0] for row in ids]
+        picks = [
+            mmr_select(query, _reconstruct(index, row), k=k, lambda_mult=lambda_mult) if len(row) else []
+            for query, row in zip(queries, id_rows)
+        ]
+
+    results = []
+    for id_row, pick_row in zip(id_rows, picks):
+        docstore_ids = [vectorstore.index_to_docstore_id[int(id_row[p])] for p in pick_row]
+        results.append([vectorstore.docstore.search(doc_id) for doc_id in docstore_ids])
+    return results
+
+
+class FastMMRRetriever(BaseRetriever):
+    """Retriever using the vectorized MMR selection above."""
+
+    vectorstore: FAISS
+    k: int = 4
+    fetch_k: int = 20
+    lambda_mult: float = 0.5
+    # True only for symmetric models (e.g. all-MiniLM-L6-v2), see retriever_utils.embed_queries
+    symmetric_embeddings: bool = False
+
+    def _get_relevant_documents(self, query, *, run_manager=None):
+        vector = self.vectorstore.embeddings.embed_query(query)
+        return mmr_search(self.vectorstore, [vector], self.k, self.fetch_k, self.lambda_mult)[0]
+
+    def batch_search(self, queries):
+        """Retrieve for many queries with one FAISS search (and one embedding call if symmetric)."""
+        vectors = embed_queries(self.vectorstore.embeddings, queries, self.symmetric_embeddings)
+        return mmr_search(self.vectorstore, vectors, self.k, self.fetch_k, self.lambda_mult)
+
+
+if __name__ == "__main__":
+    # Step 1: Create sample documents about web development
+    docs = [
+        Document(page_content="React is a JavaScript library for building user interfaces."),
+        Document(page_content="React helps developers create interactive web applications easily."),
+        Document(page_content="Django is a Python web framework for rapid development."),
+        Document(page_content="HTML and CSS are fundamental for web page structure and styling."),
+        Document(page_content="Database systems store and manage application data efficiently."),
+        Document(page_content="React, Angular, and Vue are popular frontend frameworks today."),
+    ]
+
+    # Step 2: Build the FAISS store with local embeddings
+    embedding_model = HuggingFaceEmbeddings(
+        model_name="sentence-transformers/all-MiniLM-L6-v2"
+    )
+    vectorstore = FAISS.from_documents(documents=docs, embedding=embedding_model)
+
+    # Step 3: Single query through the retriever interface
+    retriever = FastMMRRetriever(vectorstore=vectorstore, k=3, fetch_k=6, lambda_mult=0.5,
+                                 symmetric_embeddings=True)
+    for i, doc in enumerate(retriever.invoke("What is React?")):
+        print(f"--- Result {i+1} ---\n{doc.page_content}\n")
+
+    # Step 4: Several queries in one batch
+    queries = ["What is React?", "How do websites store data?"]
+    for query, results in zip(queries, retriever.batch_search(queries)):
+        print(f"{query} -> {[doc.page_content[:40] for doc in results]}")
@@ -0,0 +1,156 @@
+"""
+Fast Multi-Query Retriever Example
+Same idea as MultiQuery_Retriver.py, but cheaper per query:
+  - generated query variants are cached per normalized query, so repeated
+    questions skip the LLM entirely
+  - the original query and all variants are embedded together: concurrently with
+    embed_query, or in ONE embed_documents call when symmetric_embeddings=True
+  - the vector searches run concurrently in a thread pool
+  - results are merged with reciprocal-rank fusion and de-duplicated by
+    content hash
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from dotenv import load_dotenv
+from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models import BaseLanguageModel
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import PromptTemplate
+from langchain_core.retrievers import BaseRetriever
+from langchain_core.vectorstores import VectorStore
+from langchain_huggingface import HuggingFaceEmbeddings, HuggingFaceEndpoint
+from pydantic import PrivateAttr
+
+from retriever_utils import embed_queries
+
+# Same wording as langchain's MultiQueryRetriever default prompt
+QUERY_PROMPT = PromptTemplate(
+    input_variables=["question"],
+    template="""You are an AI language model assistant. Your task is
+    to generate 3 different versions of the given user
+    question to retrieve relevant documents from a vector  database.
+    By generating multiple perspectives on the user question,
+    your goal is to help the user overcome some of the limitations
+    of distance-based similarity search. Provide these alternative
+    questions separated by newlines. Original question: {question}""",
+)
+
+
+def normalize_query(query):
+    return " ".join(query.lower().split())
+
+
+class FastMultiQueryRetriever(BaseRetriever):
+    """Multi-query retrieval with cached variants, batched embedding and RRF merging."""
+
+    vectorstore: VectorStore
+    llm: BaseLanguageModel
+    embeddings: Embeddings | None = None  # defaults to the vector store's embeddings
+    k: int = 5
+    rrf_k: int = 60
+    max_workers: int = 8
+    cache_size: int = 1024
+    # True only for symmetric models (e.g. all-MiniLM-L6-v2): queries are then embedded
+    # in one embed_documents call instead of one embed_query call each
+    symmetric_embeddings: bool = False
+
+    _cache: OrderedDict = PrivateAttr(default_factory=OrderedDict)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _pool: ThreadPoolExecutor | None = PrivateAttr(default=None)
+
+    def model_post_init(self, __context):
+        # Created up front: lazy creation would race under retriever.batch
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+
+    def generate_variants(self, query):
+        """LLM-generated rephrasings of `query`, cached per normalized query."""
+        key = normalize_query(query)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        text = (QUERY_PROMPT | self.llm | StrOutputParser()).invoke({"question": query})
+        variants = [line.strip() for line in text.split("\n") if line.strip()]
+
+        with self._lock:
+            self._cache[key] = variants
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return variants
+
+    def _get_relevant_documents(self, query, *, run_manager=None):
+        queries = list(dict.fromkeys([query, *self.generate_variants(query)]))
+
+        embeddings = self.embeddings or self.vectorstore.embeddings
+        vectors = embed_queries(embeddings, queries, self.symmetric_embeddings, self._pool)
+
+        # Vector searches run concurrently (FAISS releases the GIL while searching)
+        ranked_lists = list(self._pool.map(
+            lambda vector: self.vectorstore.similarity_search_by_vector(vector, k=self.k), vectors
+        ))
+
+        # Reciprocal-rank fusion, de-duplicated by content hash
+        scores, docs = {}, {}
+        for ranked in ranked_lists:
+            for rank, doc in enumerate(ranked):
+                key = hashlib.sha256(doc.page_content.encode("utf-8")).hexdigest()
+                scores[key] = scores.get(key, 0.0) + 1.0 / (self.rrf_k + rank + 1)
+                docs.setdefault(key, doc)
+
+        best = sorted(scores, key=scores.get, reverse=True)[:self.k]
+        return [docs[key] for key in best]
+
+
+if __name__ == "__main__":
+    import time
+
+    # Load environment variables from .env file
+    load_dotenv()
+
+    # Step 1: Create diverse documents about fitness and technology
+    all_docs = [
+        Document(page_content="Daily exercise improves cardiovascular health and mental wellbeing.", metadata={"source": "F1"}),
+        Document(page_content="Green vegetables and fresh fruits provide essential vitamins and antioxidants.", metadata={"source": "F2"}),
+        Document(page_content="Quality sleep helps the body recover and strengthens immune function.", metadata={"source": "F3"}),
+        Document(page_content="Meditation and yoga reduce stress and enhance focus and concentration.", metadata={"source": "F4"}),
+        Document(page_content="Staying hydrated supports digestion and maintains body temperature.", metadata={"source": "F5"}),
+        Document(page_content="Cloud computing enables scalable storage and processing of data.", metadata={"source": "T1"}),
+        Document(page_content="JavaScript offers flexibility for both frontend and backend development.", metadata={"source": "T2"}),
+        Document(page_content="Solar panels convert sunlight into renewable electrical power.", metadata={"source": "T3"}),
+    ]
+
+    # Step 2: Build the vector store with local embeddings
+    embedding_model = HuggingFaceEmbeddings(
+        model_name="sentence-transformers/all-MiniLM-L6-v2"
+    )
+    vectorstore = FAISS.from_documents(documents=all_docs, embedding=embedding_model)
+
+    # Step 3: Create the fast multi-query retriever
+    llm = HuggingFaceEndpoint(
+        repo_id="google/flan-t5-base",
+        temperature=0.7,
+        max_length=512
+    )
+    retriever = FastMultiQueryRetriever(vectorstore=vectorstore, llm=llm, k=5, symmetric_embeddings=True)
+
+    # Step 4: The second identical question is served without calling the LLM
+    query = "How to boost vitality and stay healthy?"
+    for attempt in range(2):
+        start = time.perf_counter()
+        results = retriever.invoke(query)
+        print(f"\nAttempt {attempt + 1}: {time.perf_counter() - start:.2f}s")
+
+    for i, doc in enumerate(results):
+        print(f"\nResult {i+1} [{doc.metadata['source']}]:")
+        print(doc.page_content)
@@ -0,0 +1,159 @@
+"""
+Persistent ANN Index Example
+The other retriever scripts call FAISS.from_documents on every start. That
+re-embeds the whole corpus and builds an exact (brute-force) flat index.
+This script instead:
+  - builds an approximate index (HNSW or IVF-PQ) ONCE, embedding the corpus in
+    batches, and saves it to disk
+  - memory-maps the saved index on later starts, so startup does not depend on
+    corpus size and nothing is re-embedded (HNSW needs faiss >= 1.10 for this;
+    older versions only map IVF-PQ inverted lists and read HNSW into RAM)
+  - exposes the recall/latency knobs through as_retriever:
+      search_kwargs={"k": 4, "ef_search": 128}   (HNSW)
+      search_kwargs={"k": 4, "nprobe": 16}       (IVF-PQ)
+"""
+
+import pickle
+from pathlib import Path
+
+import faiss
+import numpy as np
+from langchain_community.docstore.in_memory import InMemoryDocstore
+from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.utils import DistanceStrategy
+from langchain_core.documents import Document
+from langchain_huggingface import HuggingFaceEmbeddings
+
+
+# IO_FLAG_MMAP_IFC (faiss >= 1.10) maps flat/HNSW storage too; IO_FLAG_MMAP only maps IVF lists
+MMAP_FLAG = getattr(faiss, "IO_FLAG_MMAP_IFC", faiss.IO_FLAG_MMAP)
+
+
+class ANNFAISS(FAISS):
+    """FAISS store that accepts nprobe / ef_search as search kwargs."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Cosine similarity = inner product on unit vectors. Passing normalize_L2=True with
+        # MAX_INNER_PRODUCT makes langchain warn on every build/load, so it is switched on here
+        self._normalize_L2 = True
+
+    def similarity_search_with_score_by_vector(self, embedding, k=4, filter=None, fetch_k=20, **kwargs):
+        nprobe = kwargs.pop("nprobe", None)
+        ef_search = kwargs.pop("ef_search", None)
+        # Note: these are index-wide settings, shared by concurrent searches
+        params = faiss.ParameterSpace()
+        if nprobe is not None:
+            params.set_index_parameter(self.index, "nprobe", nprobe)
+        if ef_search is not None:
+            params.set_index_parameter(self.index, "efSearch", ef_search)
+        return super().similarity_search_with_score_by_vector(embedding, k, filter, fetch_k, **kwargs)
+
+
+def _new_index(index_type, dim, hnsw_m, ef_construction, nlist, pq_m, nbits):
+    if index_type == "hnsw":
+        index = faiss.IndexHNSWFlat(dim, hnsw_m, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = ef_construction
+        return index
+    if index_type == "ivfpq":
+        quantizer = faiss.IndexFlatIP(dim)
+        return faiss.IndexIVFPQ(quantizer, dim, nlist, pq_m, nbits, faiss.METRIC_INNER_PRODUCT)
+    raise ValueError(f"Unknown index_type {index_type!r}, use 'hnsw' or 'ivfpq'")
+
+
+def build_ann_index(docs, embeddings, folder, index_type="hnsw", batch_size=1024,
+                    hnsw_m=32, ef_construction=200, nlist=1024, pq_m=16, nbits=8,
+                    train_size=100_000):
+    """Embed `docs` in batches, build the ANN index and save it to `folder`."""
+    index = None
+    pending = []
+    for start in range(0, len(docs), batch_size):
+        batch = [doc.page_content for doc in docs[start:start + batch_size]]
+        vectors = np.asarray(embeddings.embed_documents(batch), dtype=np.float32)
+        faiss.normalize_L2(vectors)  # inner product on unit vectors = cosine similarity
+
+        if index is None:
+            index = _new_index(index_type, vectors.shape[1], hnsw_m, ef_construction, nlist, pq_m, nbits)
+        if index.is_trained:
+            index.add(vectors)
+            continue
+
+        # IVF-PQ must be trained first: buffer vectors until we have a training sample
+        pending.append(vectors)
+        if sum(len(v) for v in pending) >= train_size:
+            sample = np.vstack(pending)
+            index.train(sample)
+            index.add(sample)
+            pending = []
+
+    if pending:
+        sample = np.vstack(pending)
+        if len(sample) < max(nlist, 2 ** nbits):
+            raise ValueError(
+                f"IVF-PQ needs at least {max(nlist, 2 ** nbits)} vectors to train, got {len(sample)}; "
+                "lower nlist/nbits or use index_type='hnsw'"
+            )
+        index.train(sample)
+        index.add(sample)
+
+    ids = [str(i) for i in range(len(docs))]
+    store = ANNFAISS(
+        embedding_function=embeddings,
+        index=index,
+        docstore=InMemoryDocstore(dict(zip(ids, docs))),
+        index_to_docstore_id=dict(enumerate(ids)),
+        distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT,
+    )
+    store.save_local(folder)
+    return store
+
+
+def load_ann_index(folder, embeddings):
+    """Open a saved index memory-mapped (read-only) without re-embedding anything."""
+    folder = Path(folder)
+    index = faiss.read_index(str(folder / "index.faiss"), MMAP_FLAG | faiss.IO_FLAG_READ_ONLY)
+    # index.pkl is written by build_ann_index above, so it is trusted
+    with open(folder / "index.pkl", "rb") as f:
+        docstore, index_to_docstore_id = pickle.load(f)
+    return ANNFAISS(
+        embedding_function=embeddings,
+        index=index,
+        docstore=docstore,
+        index_to_docstore_id=index_to_docstore_id,
+        distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT,
+    )
+
+
+def load_or_build(docs, embeddings, folder, **build_kwargs):
+    if (Path(folder) / "index.faiss").exists():
+        return load_ann_index(folder, embeddings)
+    return build_ann_index(docs, embeddings, folder, **build_kwargs)
+
+
+if __name__ == "__main__":
+    import time
+
+    docs = [
+        Document(page_content="Python is a high-level programming language known for simplicity."),
+        Document(page_content="Vector databases store data as numerical embeddings for fast search."),
+        Document(page_content="Machine learning models convert text into numerical vectors."),
+        Document(page_content="HuggingFace provides pre-trained models for various NLP tasks."),
+    ]
+
+    embedding_model = HuggingFaceEmbeddings(
+        model_name="sentence-transformers/all-MiniLM-L6-v2"
+    )
+
+    # Step 1: First run builds and saves the index, later runs just memory-map it
+    start = time.perf_counter()
+    vectorstore = load_or_build(docs, embedding_model, "ann_index", index_type="hnsw")
+    print(f"Vector store ready in {time.perf_counter() - start:.3f}s")
+
+    # Step 2: Recall/latency knobs go through as_retriever like any other search kwarg
+    retriever = vectorstore.as_retriever(search_kwargs={"k": 2, "ef_search": 64})
+
+    query = "What is a vector database?"
+    print(f"\nQuery: {query}\n")
+    for i, doc in enumerate(retriever.invoke(query)):
+        print(f"--- Result {i+1} ---")
+        print(doc.page_content)
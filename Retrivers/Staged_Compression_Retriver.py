@@ -0,0 +1,161 @@
+"""
+Staged Contextual Compression Example
+Contextual_Compression_Retriver.py makes one LLM call per retrieved document.
+This compressor does the cheap work first and only asks the LLM at the end:
+  1. split every document into sentences and drop sentences whose embedding
+     similarity to the query is below a threshold (local embeddings, one call)
+  2. drop sentences that are near-duplicates of an already kept sentence
+  3. send the surviving snippets, numbered and batched, to the LLM in as few
+     calls as possible and keep only the snippets it selects
+
+Run benchmark_retrievers.py to compare LLM calls and latency with the
+LLMChainExtractor-based retriever.
+"""
+
+import re
+
+import numpy as np
+from dotenv import load_dotenv
+from langchain.retrievers.contextual_compression import ContextualCompressionRetriever
+from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
+from langchain_core.documents.compressor import BaseDocumentCompressor
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models import BaseLanguageModel
+from langchain_huggingface import HuggingFaceEmbeddings, HuggingFaceEndpoint
+from pydantic import ConfigDict
+
+from retriever_utils import unit_rows
+
+SELECT_PROMPT = """Question: {question}
+
+Snippets:
+{snippets}
+
+Return the numbers of the snippets that help answer the question, comma separated.
+If none of them help, return NONE.
+Numbers:"""
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+|\n+")
+
+
+def split_sentences(text):
+    return [s.strip() for s in _SENTENCE_END.split(text) if s.strip()]
+
+
+class StagedCompressor(BaseDocumentCompressor):
+    """Embedding filter -> redundancy filter -> one batched LLM selection step."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    embeddings: Embeddings
+    llm: BaseLanguageModel | None = None  # None skips the LLM stage entirely
+    similarity_threshold: float = 0.3
+    redundancy_threshold: float = 0.9
+    snippets_per_call: int = 20
+
+    def compress_documents(self, documents, query, callbacks=None):
+        # Stage 1: sentence split + similarity filter, all sentences in one embedding call
+        sentences = [
+            (doc_index, position, sentence)
+            for doc_index, doc in enumerate(documents)
+            for position, sentence in enumerate(split_sentences(doc.page_content))
+        ]
+        if not sentences:
+            return []
+        vectors = unit_rows(self.embeddings.embed_documents([s for _, _, s in sentences]))
+        query_vector = unit_rows([self.embeddings.embed_query(query)])[0]
+        scores = vectors @ query_vector
+
+        # Stage 2: greedy redundancy removal, most relevant sentences first
+        kept = []
+        for i in np.argsort(-scores):
+            if scores[i] < self.similarity_threshold:
+                break
+            if kept and np.max(vectors[kept] @ vectors[i]) > self.redundancy_threshold:
+                continue
+            kept.append(int(i))
+
+        # Stage 3: ask the LLM only about the survivors
+        if self.llm is not None and kept:
+            kept = self._llm_select(query, [sentences[i][2] for i in kept], kept, callbacks)
+
+        # Rebuild documents from their surviving sentences, in original order
+        by_doc = {}
+        for i in sorted(kept, key=lambda i: sentences[i][:2]):
+            by_doc.setdefault(sentences[i][0], []).append(sentences[i][2])
+        return [
+            Document(page_content=" ".join(parts), metadata=documents[doc_index].metadata)
+            for doc_index, parts in by_doc.items()
+        ]
+
+    def _llm_select(self, query, snippets, ids, callbacks):
+        batches = [
+            range(start, min(start + self.snippets_per_call, len(snippets)))
+            for start in range(0, len(snippets), self.snippets_per_call)
+        ]
+        prompts = [
+            SELECT_PROMPT.format(
+                question=query,
+                snippets="\n".join(f"[{n + 1}] {snippets[i]}" for n, i in enumerate(batch)),
+            )
+            for batch in batches
+        ]
+        answers = self.llm.batch(prompts, config={"callbacks": callbacks})
+
+        selected = []
+        for batch, answer in zip(batches, answers):
+            text = getattr(answer, "content", answer)
+            numbers = {int(n) for n in re.findall(r"\d+", text)}
+            if not numbers and "NONE" not in text.upper():
+                # Unparseable answer: keep the whole batch rather than lose context
+                selected.extend(ids[i] for i in batch)
+                continue
+            selected.extend(ids[i] for n, i in enumerate(batch) if n + 1 in numbers)
+        return selected
+
+
+if __name__ == "__main__":
+    # Load environment variables from .env file
+    load_dotenv()
+
+    # Step 1: Same mixed relevant/irrelevant documents as Contextual_Compression_Retriver.py
+    docs = [
+        Document(page_content="""
+            The Eiffel Tower is a famous landmark in Paris, France.
+            Renewable energy sources include solar panels and wind turbines.
+            Millions of tourists visit Paris annually. The tower was built in 1889.
+        """, metadata={"source": "Doc1"}),
+        Document(page_content="""
+            Ancient Rome was a powerful civilization in Mediterranean history.
+            Wind turbines generate electricity by converting kinetic energy.
+            Gladiators fought in the Colosseum. Roman engineering was advanced.
+        """, metadata={"source": "Doc2"}),
+        Document(page_content="""
+            Modern cinema began in the early 1900s with silent black-and-white films.
+            Directors like Chaplin pioneered filmmaking. Solar panels convert sunlight to electricity.
+        """, metadata={"source": "Doc3"}),
+    ]
+
+    embedding_model = HuggingFaceEmbeddings(
+        model_name="sentence-transformers/all-MiniLM-L6-v2"
+    )
+    vectorstore = FAISS.from_documents(docs, embedding_model)
+    base_retriever = vectorstore.as_retriever(search_kwargs={"k": 3})
+
+    # Step 2: Staged compressor, with the LLM only used as the final filter
+    llm = HuggingFaceEndpoint(
+        repo_id="google/flan-t5-large",
+        temperature=0.1,
+        max_length=512
+    )
+    compression_retriever = ContextualCompressionRetriever(
+        base_retriever=base_retriever,
+        base_compressor=StagedCompressor(embeddings=embedding_model, llm=llm),
+    )
+
+    # Step 3: Query the retriever
+    query = "What are renewable energy sources?"
+    print(f"\nQuery: {query}\n")
+    for i, doc in enumerate(compression_retriever.invoke(query)):
+        print(f"Result {i+1} [from {doc.metadata['source']}]: {doc.page_content}")
@@ -0,0 +1,70 @@
+"""
+MMR Benchmark
+Times langchain's maximal_marginal_relevance (one query at a time) against the
+vectorized mmr_select from Fast_MMR_Retriver.py at fetch_k = 20 / 200 / 2000,
+on random 384-dimensional vectors (the size of all-MiniLM-L6-v2). It also
+checks that both pick the same documents.
+
+Usage:
+  python benchmark_mmr.py --queries 32 --k 10
+"""
+
+import argparse
+import time
+
+import numpy as np
+from langchain_community.vectorstores.utils import maximal_marginal_relevance
+
+from Fast_MMR_Retriver import mmr_select
+
+
+def time_call(fn, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(fetch_ks, num_queries, k, dim, lambda_mult, repeats, seed=0):
+    rng = np.random.default_rng(seed)
+    results = {}
+    for fetch_k in fetch_ks:
+        queries = rng.standard_normal((num_queries, dim)).astype(np.float32)
+        candidates = rng.standard_normal((num_queries, fetch_k, dim)).astype(np.float32)
+
+        baseline_time, baseline = time_call(lambda: [
+            maximal_marginal_relevance(q, list(c), lambda_mult=lambda_mult, k=k)
+            for q, c in zip(queries, candidates)
+        ], repeats)
+        fast_time, fast = time_call(
+            lambda: mmr_select(queries, candidates, k=k, lambda_mult=lambda_mult), repeats
+        )
+
+        agreement = np.mean([list(b) == list(f) for b, f in zip(baseline, fast)])
+        results[str(fetch_k)] = {
+            "langchain_ms": round(baseline_time * 1000, 2),
+            "vectorized_ms": round(fast_time * 1000, 2),
+            "speedup": round(baseline_time / fast_time, 1),
+            "same_selection": float(agreement),
+        }
+        print(f"fetch_k={fetch_k:<6} {results[str(fetch_k)]}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--fetch-k", type=int, nargs="+", default=[20, 200, 2000])
+    parser.add_argument("--queries", type=int, default=32)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--lambda-mult", type=float, default=0.5)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    run(args.fetch_k, args.queries, args.k, args.dim, args.lambda_mult, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+"""
+Retriever Benchmark
+Runs every retrieval strategy in this folder over the same fixed corpus and
+labelled queries, and reports what each one costs:
+  - p50 / p95 latency per query
+  - LLM calls and embedding calls per query
+  - recall@k against the labelled relevant documents
+
+LLM-based strategies use StandInLLM, a deterministic local stand-in with a
+configurable latency, so runs are reproducible and need no API token.
+Embeddings come from the local all-MiniLM-L6-v2 model.
+
+The Wikipedia retrievers are run against wikipedia_stub_server.py (with a
+configurable per-request delay) and report HTTP requests per query instead of
+LLM / embedding calls; recall does not apply, since they search Wikipedia
+rather than the fixed corpus:
+  - wikipedia:         CachedWikipediaRetriever with ttl_seconds=0 and one worker,
+                       i.e. every query goes to the API and the pages are
+                       fetched one after another, as in Wikipedia_Retriver.py
+  - cached_wikipedia:  disk cache emptied every repeat (cold), then warm
+
+Usage:
+  python benchmark_retrievers.py --k 4 --llm-latency 0.2 --wiki-delay 0.05 --output retriever_benchmark.json
+"""
+
+import argparse
+import json
+import re
+import shutil
+import tempfile
+import threading
+import time
+
+import numpy as np
+from langchain.retrievers.contextual_compression import ContextualCompressionRetriever
+from langchain.retrievers.document_compressors import LLMChainExtractor
+from langchain.retrievers.multi_query import MultiQueryRetriever
+from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.llms import LLM
+from langchain_huggingface import HuggingFaceEmbeddings
+from pydantic import PrivateAttr
+
+from Cached_Wikipedia_Retriver import CachedWikipediaRetriever
+from Fast_MMR_Retriver import FastMMRRetriever
+from Fast_MultiQuery_Retriver import FastMultiQueryRetriever
+from Staged_Compression_Retriver import StagedCompressor
+from wikipedia_stub_server import StubHandler, start_stub_server
+
+# ------------------ Fixed corpus ------------------
+CORPUS = [
+    Document(page_content="Daily exercise improves cardiovascular health and mental wellbeing.", metadata={"source": "F1"}),
+    Document(page_content="Green vegetables and fresh fruits provide essential vitamins and antioxidants.", metadata={"source": "F2"}),
+    Document(page_content="Quality sleep helps the body recover and strengthens immune function.", metadata={"source": "F3"}),
+    Document(page_content="Meditation and yoga reduce stress and enhance focus and concentration.", metadata={"source": "F4"}),
+    Document(page_content="Staying hydrated supports digestion and maintains body temperature.", metadata={"source": "F5"}),
+    Document(page_content="Cloud computing enables scalable storage and processing of data.", metadata={"source": "T1"}),
+    Document(page_content="JavaScript offers flexibility for both frontend and backend development.", metadata={"source": "T2"}),
+    Document(page_content="Quantum computers process information using quantum mechanics principles.", metadata={"source": "T3"}),
+    Document(page_content="React is a JavaScript library for building user interfaces.", metadata={"source": "W1"}),
+    Document(page_content="React helps developers create interactive web applications easily.", metadata={"source": "W2"}),
+    Document(page_content="Django is a Python web framework for rapid development.", metadata={"source": "W3"}),
+    Document(page_content="HTML and CSS are fundamental for web page structure and styling.", metadata={"source": "W4"}),
+    Document(page_content="Database systems store and manage application data efficiently.", metadata={"source": "W5"}),
+    Document(page_content="React, Angular, and Vue are popular frontend frameworks today.", metadata={"source": "W6"}),
+    Document(page_content="Solar panels convert sunlight into renewable electrical power. Millions of tourists visit Paris annually.", metadata={"source": "E1"}),
+    Document(page_content="Wind turbines generate electricity by converting kinetic energy. Gladiators fought in the Colosseum.", metadata={"source": "E2"}),
+    Document(page_content="Hydroelectric dams produce renewable energy from flowing water.", metadata={"source": "E3"}),
+    Document(page_content="The Eiffel Tower is a famous landmark in Paris, France, built in 1889.", metadata={"source": "L1"}),
+    Document(page_content="Ancient Rome was a powerful civilization in Mediterranean history.", metadata={"source": "L2"}),
+    Document(page_content="Football is the world's most popular sport. FIFA organizes the World Cup.", metadata={"source": "S1"}),
+    Document(page_content="The Olympics bring together athletes from nations worldwide.", metadata={"source": "S2"}),
+    Document(page_content="Cricket is played between two teams of eleven players on an oval field.", metadata={"source": "S3"}),
+]
+
+# Each query is labelled with the sources that should be retrieved
+QUERIES = [
+    ("How to boost vitality and stay healthy?", {"F1", "F2", "F3", "F5"}),
+    ("Ways to reduce stress and improve focus", {"F4"}),
+    ("What is React?", {"W1", "W2", "W6"}),
+    ("Which frameworks are used for web development?", {"W3", "W6", "T2"}),
+    ("What are renewable energy sources?", {"E1", "E2", "E3"}),
+    ("Famous landmarks and history of Europe", {"L1", "L2"}),
+    ("Popular international sports competitions", {"S1", "S2"}),
+    ("How is data stored and processed at scale?", {"T1", "W5"}),
+]
+
+STOPWORDS = {
+    "what", "which", "where", "when", "how", "are", "the", "and", "for", "with", "used",
+    "ways", "from", "that", "this", "into", "about", "known", "stay",
+}
+
+
+def content_words(text):
+    """Lower-cased words longer than 3 characters, minus question words."""
+    return [w for w in re.findall(r"[a-z]+", text.lower()) if len(w) > 3 and w not in STOPWORDS]
+
+
+# ------------------ Instrumented models ------------------
+class CountingEmbeddings(Embeddings):
+    """Embeddings wrapper that counts calls and embedded texts."""
+
+    def __init__(self, embeddings):
+        self.embeddings = embeddings
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.calls = 0
+        self.texts = 0
+
+    def _count(self, n):
+        with self._lock:
+            self.calls += 1
+            self.texts += n
+
+    def embed_documents(self, texts):
+        self._count(len(texts))
+        return self.embeddings.embed_documents(texts)
+
+    def embed_query(self, text):
+        self._count(1)
+        return self.embeddings.embed_query(text)
+
+
+class StandInLLM(LLM):
+    """Deterministic local LLM with fixed latency, answering the prompts our retrievers send."""
+
+    latency: float = 0.1
+    _calls: int = PrivateAttr(default=0)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    @property
+    def _llm_type(self):
+        return "stand-in"
+
+    @property
+    def calls(self):
+        return self._calls
+
+    def reset(self):
+        self._calls = 0
+
+    def _call(self, prompt, stop=None, run_manager=None, **kwargs):
+        with self._lock:
+            self._calls += 1
+        time.sleep(self.latency)
+        return respond(prompt)
+
+
+def respond(prompt):
+    """Canned but input-dependent answers for the prompt formats we know."""
+    # MultiQueryRetriever: "... Original question: {question}"
+    if "Original question:" in prompt:
+        question = prompt.rsplit("Original question:", 1)[1].strip()
+        words = content_words(question) or [question]
+        return "\n".join([
+            f"What is known about {' '.join(words)}?",
+            f"Tips and facts on {' and '.join(words[:2])}",
+            f"Explain {words[-1]}",
+        ])
+
+    # LLMChainExtractor: "> Question: ...\n> Context:\n>>>\n...\n>>>"
+    if "> Question:" in prompt and ">>>" in prompt:
+        question = prompt.split("> Question:", 1)[1].split("\n", 1)[0]
+        context = prompt.split(">>>", 2)[1]
+        stems = {w[:5] for w in content_words(question)}
+        sentences = re.split(r"(?<=[.!?])\s+", context.strip())
+        relevant = [s for s in sentences if stems & {w[:5] for w in content_words(s)}]
+        return " ".join(relevant) if relevant else "NO_OUTPUT"
+
+    # StagedCompressor: "Question: ...\n\nSnippets:\n[1] ...\n[2] ..."
+    if "Snippets:" in prompt and prompt.startswith("Question:"):
+        question = prompt.split("\n", 1)[0]
+        stems = {w[:5] for w in content_words(question)}
+        picks = [
+            number for number, snippet in re.findall(r"^\[(\d+)\] (.*)$", prompt, flags=re.M)
+            if stems & {w[:5] for w in content_words(snippet)}
+        ]
+        return ", ".join(picks) if picks else "NONE"
+
+    return ""
+
+
+# ------------------ Strategies ------------------
+def build_vectorstore(embeddings):
+    return FAISS.from_documents(CORPUS, embeddings)
+
+
+def build_strategies(vectorstore, llm, embeddings, k):
+    """Name -> retriever for every strategy under test."""
+    base = vectorstore.as_retriever(search_kwargs={"k": k})
+    return {
+        "similarity": base,
+        "mmr": vectorstore.as_retriever(
+            search_type="mmr", search_kwargs={"k": k, "fetch_k": 20, "lambda_mult": 0.5}
+        ),
+        "fast_mmr": FastMMRRetriever(vectorstore=vectorstore, k=k, fetch_k=20, lambda_mult=0.5),
+        "multi_query": MultiQueryRetriever.from_llm(retriever=base, llm=llm),
+        "contextual_compression": ContextualCompressionRetriever(
+            base_retriever=base, base_compressor=LLMChainExtractor.from_llm(llm)
+        ),
+        # Variant cache is cleared per repeat here; "_warm" below reports cached runs
+        "fast_multi_query": FastMultiQueryRetriever(
+            vectorstore=vectorstore, llm=llm, k=k, symmetric_embeddings=True
+        ),
+        # Embedding + redundancy filters first, then a single batched LLM call
+        "staged_compression": ContextualCompressionRetriever(
+            base_retriever=base, base_compressor=StagedCompressor(embeddings=embeddings, llm=llm)
+        ),
+    }
+
+
+def build_wikipedia_strategies(api_url, cache_dir, k):
+    """Name -> Wikipedia retriever, all pointed at the stub server."""
+    return {
+        "wikipedia": CachedWikipediaRetriever(
+            top_k_results=k, api_url=api_url, cache_dir=f"{cache_dir}/uncached", ttl_seconds=0,
+            max_workers=1,
+        ),
+        "cached_wikipedia": CachedWikipediaRetriever(
+            top_k_results=k, api_url=api_url, cache_dir=f"{cache_dir}/cached"
+        ),
+    }
+
+
+# ------------------ Benchmark loop ------------------
+def recall_at_k(docs, relevant, k):
+    found = {doc.metadata.get("source") for doc in docs[:k]}
+    return len(found & relevant) / len(relevant)
+
+
+def benchmark_strategy(retriever, llm, embeddings, k, repeats, reset=None):
+    latencies, llm_calls, embed_calls, recalls = [], [], [], []
+    for _ in range(repeats):
+        if reset:
+            reset()
+        for query, relevant in QUERIES:
+            llm.reset()
+            embeddings.reset()
+            start = time.perf_counter()
+            docs = retriever.invoke(query)
+            latencies.append(time.perf_counter() - start)
+            llm_calls.append(llm.calls)
+            embed_calls.append(embeddings.calls)
+            recalls.append(recall_at_k(docs, relevant, k))
+    return {
+        "p50_latency_ms": round(float(np.percentile(latencies, 50)) * 1000, 2),
+        "p95_latency_ms": round(float(np.percentile(latencies, 95)) * 1000, 2),
+        "llm_calls_per_query": round(float(np.mean(llm_calls)), 2),
+        "embedding_calls_per_query": round(float(np.mean(embed_calls)), 2),
+        f"recall@{k}": round(float(np.mean(recalls)), 3),
+    }
+
+
+def benchmark_wikipedia(retriever, repeats, reset=None):
+    latencies, requests, found = [], [], []
+    for _ in range(repeats):
+        if reset:
+            reset()
+        for query, _ in QUERIES:
+            before = StubHandler.request_count
+            start = time.perf_counter()
+            docs = retriever.invoke(query)
+            latencies.append(time.perf_counter() - start)
+            requests.append(StubHandler.request_count - before)
+            found.append(len(docs))
+    return {
+        "p50_latency_ms": round(float(np.percentile(latencies, 50)) * 1000, 2),
+        "p95_latency_ms": round(float(np.percentile(latencies, 95)) * 1000, 2),
+        "http_requests_per_query": round(float(np.mean(requests)), 2),
+        "docs_per_query": round(float(np.mean(found)), 2),
+    }
+
+
+def run_wikipedia_benchmark(k=4, wiki_delay=0.05, repeats=3, only=None):
+    server, api_url = start_stub_server(delay=wiki_delay)
+    cache_dir = tempfile.mkdtemp(prefix="wikipedia_cache_")
+    results = {}
+    try:
+        for name, retriever in build_wikipedia_strategies(api_url, cache_dir, k).items():
+            if only and name not in only:
+                continue
+            # Cold: the cache directory is emptied before every repeat
+            reset = lambda: shutil.rmtree(retriever.cache_dir, ignore_errors=True)
+            results[name] = benchmark_wikipedia(retriever, repeats, reset)
+            print(f"{name:<26} {results[name]}")
+            if retriever.ttl_seconds > 0:
+                for query, _ in QUERIES:
+                    retriever.invoke(query)
+                results[f"{name}_warm"] = benchmark_wikipedia(retriever, repeats)
+                print(f"{name + '_warm':<26} {results[name + '_warm']}")
+    finally:
+        server.shutdown()
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    return results
+
+
+def run_benchmark(k=4, llm_latency=0.1, repeats=3, only=None, wiki_delay=0.05):
+    embeddings = CountingEmbeddings(
+        HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2")
+    )
+    llm = StandInLLM(latency=llm_latency)
+    vectorstore = build_vectorstore(embeddings)
+    strategies = build_strategies(vectorstore, llm, embeddings, k)
+
+    results = {}
+    for name, retriever in strategies.items():
+        if only and name not in only:
+            continue
+        retriever.invoke(QUERIES[0][0])  # warm-up, not measured
+        # Retrievers with a per-query cache are measured cold (cache cleared every
+        # repeat) so they compare fairly with the others, then warm on their own line
+        reset = getattr(retriever, "clear_cache", None)
+        results[name] = benchmark_strategy(retriever, llm, embeddings, k, repeats, reset)
+        print(f"{name:<26} {results[name]}")
+        if reset:
+            for query, _ in QUERIES:
+                retriever.invoke(query)
+            results[f"{name}_warm"] = benchmark_strategy(retriever, llm, embeddings, k, repeats)
+            print(f"{name + '_warm':<26} {results[name + '_warm']}")
+
+    results.update(run_wikipedia_benchmark(k, wiki_delay, repeats, only))
+
+    return {
+        "config": {"k": k, "llm_latency_s": llm_latency, "wiki_delay_s": wiki_delay, "repeats": repeats,
+                   "corpus_size": len(CORPUS), "queries": len(QUERIES)},
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--k", type=int, default=4)
+    parser.add_argument("--llm-latency", type=float, default=0.1, help="seconds per stand-in LLM call")
+    parser.add_argument("--wiki-delay", type=float, default=0.05, help="seconds per stub Wikipedia request")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--only", nargs="*", help="strategy names to run (default: all)")
+    parser.add_argument("--output", default="retriever_benchmark.json")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.k, args.llm_latency, args.repeats, args.only, args.wiki_delay)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""
+Small helpers shared by the retrievers in this folder.
+"""
+
+import numpy as np
+
+
+def unit_rows(vectors):
+    """Scale each row to unit length (zero rows stay zero), as float32."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def embed_queries(embeddings, queries, symmetric=False, pool=None):
+    """Embed several search queries.
+
+    Asymmetric models (E5 / BGE style, or HuggingFaceEmbeddings with query_encode_kwargs)
+    embed queries differently from documents, so by default each query goes through
+    embed_query, concurrently when a thread pool is given. For symmetric models such as
+    all-MiniLM-L6-v2, symmetric=True embeds them all in one embed_documents call.
+    """
+    if symmetric:
+        return embeddings.embed_documents(queries)
+    if pool is not None:
+        return list(pool.map(embeddings.embed_query, queries))
+    return [embeddings.embed_query(query) for query in queries]
@@ -0,0 +1,99 @@
+"""
+Local stub of the Wikipedia (MediaWiki) API
+Serves canned search results and page extracts for Cached_Wikipedia_Retriver.py,
+so the retriever can be exercised without network access.
+
+Usage:
+  python wikipedia_stub_server.py --port 8765
+  # then point the retriever at http://127.0.0.1:8765/w/api.php
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+PAGES = {
+    "Artificial intelligence": (
+        "Artificial intelligence (AI) is the capability of computational systems to perform tasks "
+        "typically associated with human intelligence, such as learning, reasoning and perception."
+    ),
+    "Machine learning": (
+        "Machine learning (ML) is a field of study in artificial intelligence concerned with statistical "
+        "algorithms that can learn from data and generalise to unseen data."
+    ),
+    "Applications of artificial intelligence": (
+        "Artificial intelligence is used in search engines, recommendation systems, speech recognition, "
+        "self-driving cars, medical diagnosis and many other applications."
+    ),
+    "Cricket": (
+        "Cricket is a bat-and-ball game played between two teams of eleven players on a field "
+        "at the centre of which is a 22-yard pitch."
+    ),
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    delay = 0.0          # seconds added to every response, to simulate network latency
+    request_count = 0
+    _lock = threading.Lock()
+
+    def do_GET(self):
+        with StubHandler._lock:
+            StubHandler.request_count += 1
+        time.sleep(self.delay)
+
+        params = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+        if params.get("list") == "search":
+            words = set(params.get("srsearch", "").lower().split())
+            limit = int(params.get("srlimit", 10))
+            ranked = sorted(PAGES, key=lambda t: -len(words & set(PAGES[t].lower().split())))
+            body = {"query": {"search": [{"title": t} for t in ranked[:limit]]}}
+        elif params.get("prop"):
+            title = params.get("titles", "")
+            if title in PAGES:
+                page = {
+                    "title": title,
+                    "extract": PAGES[title],
+                    "fullurl": f"https://en.wikipedia.org/wiki/{title.replace(' ', '_')}",
+                }
+                body = {"query": {"pages": {str(abs(hash(title)) % 10**6): page}}}
+            else:
+                body = {"query": {"pages": {"-1": {"title": title, "missing": ""}}}}
+        else:
+            self.send_error(400, "unsupported request")
+            return
+
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass  # keep test output quiet
+
+
+def start_stub_server(port=0, delay=0.0):
+    """Start the stub in a background thread; returns (server, api_url)."""
+    StubHandler.delay = delay
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/w/api.php"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server, url = start_stub_server(args.port, args.delay)
+    print(f"Stub Wikipedia API running at {url} (Ctrl+C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
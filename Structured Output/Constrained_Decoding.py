@@ -0,0 +1,159 @@
+"""
+JSON-Schema Constrained Decoding Example
+with_structured_output does not work with ChatHuggingFace (see
+with_structured_output_pydantic.py), so the usual fallback is to prompt for JSON
+and retry when parsing fails, paying for a whole generation each time.
+
+With a LOCAL model (HuggingFacePipeline) we control decoding, so instead:
+  - the Pydantic model / JSON schema is compiled into a character-level JSON
+    parser (lm-format-enforcer)
+  - at every generation step the parser masks out every token that would make
+    the output invalid (transformers' prefix_allowed_tokens_fn)
+  - the output is therefore schema-valid in a single pass, with no retries
+
+Compiling is cached: the tokenizer vocabulary scan once per tokenizer, the schema
+parser once per (schema, tokenizer). The token enforcer itself is built per call:
+its memo is keyed by the whole prompt + output token sequence, so a shared one
+would only help identical prompts while growing by an allowed-token list for
+every generated token, and JsonSchemaParser states are not cacheable across
+prompts anyway.
+
+Requires: pip install lm-format-enforcer
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+
+from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import BaseMessage, HumanMessage
+from langchain_core.prompt_values import PromptValue
+from langchain_core.runnables import RunnableLambda
+from lmformatenforcer import JsonSchemaParser
+from lmformatenforcer.integrations.transformers import (
+    build_token_enforcer_tokenizer_data,
+    build_transformers_prefix_allowed_tokens_fn,
+)
+from pydantic import BaseModel
+
+from schema_registry import normalize_schema
+
+ROLES = {"human": "user", "ai": "assistant", "system": "system"}
+
+
+def to_json_schema(schema):
+    """Pydantic model, dict, or path to a .json file -> normalized JSON schema dict."""
+    if isinstance(schema, type) and issubclass(schema, BaseModel):
+        return schema.model_json_schema()
+    if isinstance(schema, (str, Path)):
+        schema = json.loads(Path(schema).read_text(encoding="utf-8"))
+    return normalize_schema(schema)
+
+
+@lru_cache(maxsize=None)
+def _tokenizer_data(tokenizer):
+    # Walks the whole vocabulary, so it is done once per tokenizer
+    return build_token_enforcer_tokenizer_data(tokenizer)
+
+
+@lru_cache(maxsize=128)
+def _schema_parser(schema_json, tokenizer):
+    # Per tokenizer too: the enforcer sets the parser's alphabet from the tokenizer
+    return JsonSchemaParser(json.loads(schema_json))
+
+
+def _to_prompt(tokenizer, input, schema_dict, include_schema):
+    if isinstance(input, PromptValue):
+        messages = input.to_messages()
+    elif isinstance(input, str):
+        messages = [HumanMessage(content=input)]
+    else:
+        messages = list(input)
+    chat = [
+        {"role": ROLES.get(m.type, m.type), "content": m.content} if isinstance(m, BaseMessage) else m
+        for m in messages
+    ]
+    if include_schema:
+        chat[-1] = {**chat[-1], "content": (
+            f"{chat[-1]['content']}\n\nRespond only with a JSON object matching this schema:\n"
+            f"{json.dumps(schema_dict)}"
+        )}
+    if getattr(tokenizer, "chat_template", None):
+        return tokenizer.apply_chat_template(chat, tokenize=False, add_generation_prompt=True)
+    return "\n".join(m["content"] for m in chat)
+
+
+def with_json_schema(llm, schema, include_schema_in_prompt=True):
+    """Structured-output runnable for a HuggingFacePipeline, like model.with_structured_output(schema).
+
+    Returns a Pydantic instance if `schema` is a Pydantic model, otherwise a dict.
+    """
+    pydantic_model = schema if isinstance(schema, type) and issubclass(schema, BaseModel) else None
+    schema_dict = to_json_schema(schema)
+    schema_json = json.dumps(schema_dict, sort_keys=True)
+    pipe = llm.pipeline
+    tokenizer = pipe.tokenizer
+    # One dict, so a return_full_text already in pipeline_kwargs is overridden, not duplicated
+    generate_kwargs = {**(llm.pipeline_kwargs or {}), "return_full_text": False}
+
+    def generate(input):
+        parser = _schema_parser(schema_json, tokenizer)
+        # Fresh per call (cheap): the expensive vocabulary data and parser are shared
+        prefix_fn = build_transformers_prefix_allowed_tokens_fn(_tokenizer_data(tokenizer), parser)
+        prompt = _to_prompt(tokenizer, input, schema_dict, include_schema_in_prompt)
+        output = pipe(prompt, prefix_allowed_tokens_fn=prefix_fn, **generate_kwargs)[0]["generated_text"]
+        try:
+            data = json.loads(output)
+        except json.JSONDecodeError:
+            # Only possible if max_new_tokens ran out before the object was closed
+            raise OutputParserException(
+                "Generation stopped before the JSON was complete; increase max_new_tokens",
+                llm_output=output,
+            )
+        return pydantic_model.model_validate(data) if pydantic_model else data
+
+    return RunnableLambda(generate)
+
+
+if __name__ == "__main__":
+    import os
+
+    os.environ.setdefault('HF_HOME', '/home/bumblebee/huggingface_cache')
+
+    from typing import Literal, Optional
+
+    from langchain_huggingface import HuggingFacePipeline
+    from pydantic import Field
+
+    MODEL_ID = "HuggingFaceH4/zephyr-7b-beta"
+
+    llm = HuggingFacePipeline.from_model_id(
+        model_id=MODEL_ID,
+        task='text-generation',
+        pipeline_kwargs=dict(
+            max_new_tokens=300,
+            do_sample=False
+        )
+    )
+
+    # schema
+    class Review(BaseModel):
+
+        key_themes: list[str] = Field(description="Write down all the key themes discussed in the review in a list")
+        summary: str = Field(description="A brief summary of the review")
+        sentiment: Literal["pos", "neg"] = Field(description="Return sentiment of the review either negative, positive or neutral")
+        pros: Optional[list[str]] = Field(default=None, description="Write down all the pros inside a list")
+        cons: Optional[list[str]] = Field(default=None, description="Write down all the cons inside a list")
+        name: Optional[str] = Field(default=None, description="Write the name of the reviewer")
+
+    # Step 1: Pydantic model -> Review instance, valid on the first try
+    structured_model = with_json_schema(llm, Review)
+    result = structured_model.invoke("""I recently upgraded to the Samsung Galaxy S24 Ultra, and I must say, it's an absolute powerhouse! The 5000mAh battery easily lasts a full day, but the $1,300 price tag is a hard pill to swallow.
+
+Review by Nitish Singh
+""")
+    print(result)
+
+    # Step 2: The JSON schema file works too (its shorthand properties are normalized)
+    student_model = with_json_schema(llm, "json_schema.json")
+    print(student_model.invoke("Invent a student from Pune."))
@@ -0,0 +1,119 @@
+"""
+Schema Registry Benchmark
+Validates N synthetic LLM outputs for the Review schema (some wrapped in ```json
+fences, a few invalid) three ways:
+  - per_item_new_parser:  new PydanticOutputParser + format instructions per output
+                          (what the scripts do when run once per input)
+  - per_item_parser:      one PydanticOutputParser, .parse() per output
+  - registry_batch:       SchemaRegistry.validate_batch on the whole list
+and the same outputs against the equivalent plain JSON schema (fastjsonschema).
+
+Usage:
+  python benchmark_schema_registry.py --items 5000 --invalid 0.0
+"""
+
+import argparse
+import json
+import random
+import time
+from typing import Literal, Optional
+
+from langchain_core.exceptions import OutputParserException
+from langchain_core.output_parsers import PydanticOutputParser
+from pydantic import BaseModel, Field
+
+from schema_registry import SchemaRegistry
+
+
+class Review(BaseModel):
+
+    key_themes: list[str] = Field(description="Write down all the key themes discussed in the review in a list")
+    summary: str = Field(description="A brief summary of the review")
+    sentiment: Literal["pos", "neg"] = Field(description="Return sentiment of the review either negative, positive or neutral")
+    pros: Optional[list[str]] = Field(default=None, description="Write down all the pros inside a list")
+    cons: Optional[list[str]] = Field(default=None, description="Write down all the cons inside a list")
+    name: Optional[str] = Field(default=None, description="Write the name of the reviewer")
+
+
+def synthetic_outputs(num_items, invalid_rate, seed=0):
+    rng = random.Random(seed)
+    themes = ["battery", "camera", "price", "performance", "display", "S-Pen"]
+    outputs = []
+    for i in range(num_items):
+        data = {
+            "key_themes": rng.sample(themes, 3),
+            "summary": f"Review {i}: powerful phone, heavy and expensive.",
+            "sentiment": rng.choice(["pos", "neg"]),
+            "pros": rng.sample(themes, 2),
+            "cons": ["weight", "price"],
+            "name": "Nitish Singh",
+        }
+        if rng.random() < invalid_rate:
+            data["sentiment"] = "neutral"
+        text = json.dumps(data)
+        outputs.append(f"```json\n{text}\n```" if i % 2 else text)
+    return outputs
+
+
+def timed(fn, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        valid = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, valid
+
+
+def per_item(outputs, parser_factory):
+    valid = 0
+    for text in outputs:
+        parser = parser_factory()
+        try:
+            parser.parse(text)
+            valid += 1
+        except OutputParserException:
+            pass
+    return valid
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--invalid", type=float, default=0.0, help="fraction of outputs that fail validation")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    outputs = synthetic_outputs(args.items, args.invalid)
+    registry = SchemaRegistry()
+    registry.register("review", Review)
+    registry.register("review_json", Review.model_json_schema())
+
+    def new_parser():
+        p = PydanticOutputParser(pydantic_object=Review)
+        p.get_format_instructions()
+        return p
+
+    shared = PydanticOutputParser(pydantic_object=Review)
+    runs = {
+        "per_item_new_parser": lambda: per_item(outputs, new_parser),
+        "per_item_parser": lambda: per_item(outputs, lambda: shared),
+        "registry_batch": lambda: sum(e is None for e in registry.validate_batch("review", outputs)[1]),
+        "registry_batch_jsonschema": lambda: sum(e is None for e in registry.validate_batch("review_json", outputs)[1]),
+    }
+
+    results = {}
+    baseline = None
+    for name, fn in runs.items():
+        seconds, valid = timed(fn, args.repeats)
+        baseline = baseline or seconds
+        results[name] = {
+            "seconds": round(seconds, 4),
+            "items_per_s": round(args.items / seconds),
+            "valid": valid,
+            "speedup": round(baseline / seconds, 1),
+        }
+        print(f"{name:<26} {results[name]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+Schema Registry Example
+Scripts like with_structured_output_json.py, structured_parser_demo.py and
+Chains/Conditional.py build their schema, parser and get_format_instructions()
+text on every run, then validate results one at a time. For bulk jobs the
+registry does that work once per schema:
+  - each schema (Pydantic model, TypedDict, JSON schema dict / file, or a list of
+    ResponseSchema) is compiled once into a validator
+      Pydantic / TypedDict -> pydantic-core TypeAdapter, JSON decoded in Rust
+      JSON schema          -> fastjsonschema compiled Python code (+ orjson if installed)
+  - the format-instruction text is rendered once and cached
+  - validate_batch checks thousands of outputs in one call: the outputs are joined
+    into a single JSON array and validated in one pass; only if that fails does
+    it fall back to item-by-item to report which ones are bad
+
+See benchmark_schema_registry.py for the comparison with per-item parsing.
+"""
+
+import json
+import re
+from pathlib import Path
+
+from langchain_core.exceptions import OutputParserException
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.output_parsers.format_instructions import JSON_FORMAT_INSTRUCTIONS
+from langchain_core.utils.json import parse_json_markdown
+from pydantic import BaseModel, TypeAdapter
+
+try:
+    import orjson
+    loads = orjson.loads
+except ImportError:  # optional speed-up
+    loads = json.loads
+
+FENCED = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+
+def normalize_schema(schema):
+    """Expand shorthand like {"name": "string"} (as in json_schema.json) to {"name": {"type": "string"}}."""
+    if not isinstance(schema, dict):
+        return schema
+    schema = dict(schema)
+    if isinstance(schema.get("properties"), dict):
+        schema["properties"] = {
+            key: {"type": value} if isinstance(value, str) else normalize_schema(value)
+            for key, value in schema["properties"].items()
+        }
+    if "items" in schema:
+        items = schema["items"]
+        schema["items"] = {"type": items} if isinstance(items, str) else normalize_schema(items)
+    for key in ("$defs", "definitions"):
+        if isinstance(schema.get(key), dict):
+            schema[key] = {name: normalize_schema(sub) for name, sub in schema[key].items()}
+    for key in ("anyOf", "oneOf", "allOf"):
+        if isinstance(schema.get(key), list):
+            schema[key] = [normalize_schema(sub) for sub in schema[key]]
+    return schema
+
+
+def extract_json(text):
+    """The JSON part of an LLM answer: as is, from a ``` fence, or via parse_json_markdown."""
+    stripped = text.strip()
+    if stripped[:1] in "{[" and stripped[-1:] in "}]":
+        return stripped
+    match = FENCED.search(stripped)
+    if match:
+        return match.group(1)
+    return json.dumps(parse_json_markdown(stripped))
+
+
+def _format_instructions(schema):
+    # Same text PydanticOutputParser produces, for any JSON schema
+    reduced = {k: v for k, v in schema.items() if k not in ("title", "type")}
+    return JSON_FORMAT_INSTRUCTIONS.format(schema=json.dumps(reduced, ensure_ascii=False))
+
+
+class CompiledSchema:
+    """One registered schema: its validators and its cached format instructions."""
+
+    def __init__(self, name, schema):
+        self.name = name
+        self.source = schema  # as registered, to spot a conflicting re-registration
+        if isinstance(schema, (str, Path)):
+            schema = json.loads(Path(schema).read_text(encoding="utf-8"))
+        if isinstance(schema, list):  # [ResponseSchema, ...] as in structured_parser_demo.py
+            from langchain.output_parsers import StructuredOutputParser
+            self.format_instructions = StructuredOutputParser.from_response_schemas(schema).get_format_instructions()
+            schema = {
+                "type": "object",
+                "properties": {s.name: {"type": s.type if s.type != "List[string]" else "array"} for s in schema},
+                "required": [s.name for s in schema],
+            }
+        else:
+            self.format_instructions = None
+
+        if isinstance(schema, dict):
+            import fastjsonschema
+
+            self.json_schema = normalize_schema(schema)
+            self._check = fastjsonschema.compile(self.json_schema)
+            self._adapter = self._list_adapter = None
+        else:
+            self._adapter = TypeAdapter(schema)
+            self._list_adapter = TypeAdapter(list[schema])
+            self.json_schema = self._adapter.json_schema()
+            if isinstance(schema, type) and issubclass(schema, BaseModel):
+                self.format_instructions = PydanticOutputParser(pydantic_object=schema).get_format_instructions()
+
+        if self.format_instructions is None:
+            self.format_instructions = _format_instructions(self.json_schema)
+
+    def validate(self, text):
+        """Validate one output; raises OutputParserException."""
+        try:
+            raw = extract_json(text)
+            if self._adapter is not None:
+                return self._adapter.validate_json(raw)
+            return self._check(loads(raw))
+        except Exception as e:  # JSON, markdown and validation errors all end up here
+            raise OutputParserException(f"Output does not match schema {self.name!r}: {e}", llm_output=text)
+
+    def validate_batch(self, texts):
+        """Validate many outputs; returns (values, errors) with None in the failed / ok slots."""
+        try:
+            raw = [extract_json(text) for text in texts]
+        except Exception:
+            raw = None
+
+        if raw is not None:
+            joined = "[" + ",".join(raw) + "]"
+            try:
+                # Fast path: one decode + one validation call for the whole batch
+                if self._list_adapter is not None:
+                    values = self._list_adapter.validate_json(joined)
+                else:
+                    values = [self._check(item) for item in loads(joined)]
+                if len(values) == len(texts):
+                    return values, [None] * len(texts)
+            except Exception:
+                pass
+
+        # Slow path: at least one output is bad, find out which
+        values, errors = [], []
+        for text in texts:
+            try:
+                values.append(self.validate(text))
+                errors.append(None)
+            except OutputParserException as e:
+                values.append(None)
+                errors.append(e)
+        return values, errors
+
+
+class SchemaRegistry:
+    """Name -> CompiledSchema; each schema is compiled the first time it is registered."""
+
+    def __init__(self):
+        self._schemas = {}
+
+    def register(self, name, schema):
+        """Compile `schema` under `name`; registering the same schema again is a no-op."""
+        existing = self._schemas.get(name)
+        if existing is None:
+            existing = self._schemas[name] = CompiledSchema(name, schema)
+        elif existing.source != schema:
+            raise ValueError(f"Schema {name!r} is already registered with a different schema; pick another name")
+        return existing
+
+    def __getitem__(self, name):
+        return self._schemas[name]
+
+    def format_instructions(self, name):
+        return self._schemas[name].format_instructions
+
+    def validate(self, name, text):
+        return self._schemas[name].validate(text)
+
+    def validate_batch(self, name, texts):
+        return self._schemas[name].validate_batch(texts)
+
+
+# Shared registry so every script in a process compiles each schema only once
+registry = SchemaRegistry()
+
+
+if __name__ == "__main__":
+    from typing import Literal
+
+    from pydantic import Field
+
+    class Feedback(BaseModel):
+
+        sentiment: Literal['positive', 'negative'] = Field(description='Give the sentiment of the feedback')
+
+    registry.register("feedback", Feedback)
+    registry.register("student", "json_schema.json")
+
+    print(registry.format_instructions("feedback"))
+
+    outputs = ['{"sentiment": "positive"}', '```json\n{"sentiment": "negative"}\n```'] * 1000
+    values, errors = registry.validate_batch("feedback", outputs)
+    print(f"\n{len(values)} feedback outputs, {sum(e is not None for e in errors)} invalid")
+
+    values, errors = registry.validate_batch("student", ['{"name": "Asha", "age": 21}', '{"age": "x"}'])
+    print(values, [str(e).splitlines()[0] if e else None for e in errors])
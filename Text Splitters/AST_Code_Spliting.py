@@ -0,0 +1,242 @@
+"""
+AST-Aware Incremental Code Splitting Example
+Python_Code_Spliting.py cuts code with RecursiveCharacterTextSplitter separator
+heuristics, and any edit means re-splitting and re-embedding everything. This
+splitter:
+  - reads the `ast` tree and cuts at function and class boundaries; a class
+    larger than max_chunk_chars is split again into its methods
+  - groups the module-level statements between definitions into "glue" chunks
+  - gives every chunk a stable id (path::Qualified.name) and a content hash
+  - keeps a JSON manifest of the hashes, so re-indexing a file only emits the
+    chunks whose hash changed and the ids that disappeared
+  - can take the changed files straight from `git diff`, so re-indexing after a
+    commit costs time in proportion to the diff
+
+Usage:
+  python AST_Code_Spliting.py                                  # demo on the Student example
+  python AST_Code_Spliting.py --repo /path/to/repo --since HEAD~1
+"""
+
+import ast
+import os
+import subprocess
+from pathlib import Path
+
+from langchain.text_splitter import Language, RecursiveCharacterTextSplitter
+from langchain_core.documents import Document
+
+from manifest_utils import content_hash, load_manifest, save_manifest
+
+DEFINITIONS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
+def _segments(body, lines, start, end, scope, max_chars, header_end=None):
+    """Cut lines[start:end] into (name, first, last) line ranges at the definitions in `body`.
+
+    For a class body, lines[start:header_end] is the `class ...:` header and opens the
+    class's own glue chunk, together with its docstring and class attributes.
+    """
+    segments = []
+    glue_count = 0
+    glue_start = None if header_end is None else start
+    cursor = start if header_end is None else header_end
+
+    def size(a, b):
+        return sum(len(line) for line in lines[a:b])
+
+    def flush_glue(upto):
+        nonlocal glue_start, glue_count
+        if glue_start is not None:
+            glue_count += 1
+            name = scope or "<module>"
+            segments.append((name if glue_count == 1 else f"{name}#{glue_count}", glue_start, upto))
+            glue_start = None
+
+    for node in body:
+        node_end = node.end_lineno  # 1-based inclusive == 0-based exclusive
+        if isinstance(node, DEFINITIONS):
+            flush_glue(cursor)
+            name = f"{scope}.{node.name}" if scope else node.name
+            # Leading comments and decorators (everything since the previous node) stay with the definition
+            if isinstance(node, ast.ClassDef) and size(cursor, node_end) > max_chars:
+                first = node.body[0]
+                header_end = min([first.lineno] + [d.lineno for d in getattr(first, "decorator_list", [])]) - 1
+                segments.extend(_segments(node.body, lines, cursor, node_end, name, max_chars, header_end))
+            else:
+                segments.append((name, cursor, node_end))
+        else:
+            if glue_start is None:
+                glue_start = cursor
+            elif size(glue_start, node_end) > max_chars:
+                flush_glue(cursor)
+                glue_start = cursor
+        cursor = node_end
+
+    flush_glue(cursor)
+    if segments and cursor < end:
+        name, first, _ = segments[-1]
+        segments[-1] = (name, first, end)  # trailing comments / blank lines
+    elif not segments and start < end:
+        segments.append((scope or "<module>", start, end))
+    return segments
+
+
+def split_python(source, path="<string>", max_chunk_chars=1500):
+    """Split Python source into Documents at class / function boundaries."""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        # Not valid Python (yet): fall back to the separator-based splitter
+        splitter = RecursiveCharacterTextSplitter.from_language(
+            language=Language.PYTHON, chunk_size=max_chunk_chars, chunk_overlap=0
+        )
+        return [
+            Document(page_content=text, metadata={
+                "source": path, "chunk_id": f"{path}::<fallback>#{i}", "hash": content_hash(text.strip()),
+            })
+            for i, text in enumerate(splitter.split_text(source))
+        ]
+
+    lines = source.splitlines(keepends=True)
+    documents = []
+    seen = set()
+    for name, first, last in _segments(tree.body, lines, 0, len(lines), "", max_chunk_chars):
+        text = "".join(lines[first:last])
+        if not text.strip():
+            continue
+        # Property getter/setter pairs, @overload stubs and redefinitions share a qualname
+        unique, n = name, 1
+        while unique in seen:
+            n += 1
+            unique = f"{name}#{n}"
+        seen.add(unique)
+        leading_blank = len(text) - len(text.lstrip("\n"))
+        documents.append(Document(page_content=text.strip("\n"), metadata={
+            "source": path,
+            "chunk_id": f"{path}::{unique}",
+            "qualname": name,
+            "start_line": first + 1 + text[:leading_blank].count("\n"),
+            "end_line": last,
+            "hash": content_hash(text.strip()),
+        }))
+    return documents
+
+
+class IncrementalCodeIndex:
+    """Tracks chunk hashes per file in a JSON manifest and reports only what changed."""
+
+    def __init__(self, manifest_path="code_manifest.json", max_chunk_chars=1500):
+        self.manifest_path = Path(manifest_path)
+        self.max_chunk_chars = max_chunk_chars
+        self.manifest = load_manifest(self.manifest_path)  # path -> {"file_hash": ..., "chunks": {chunk_id: hash}}
+
+    def update(self, paths):
+        """Re-split `paths`; returns (changed_documents, removed_chunk_ids)."""
+        changed, removed = [], []
+        for path in paths:
+            key = str(path)
+            old = self.manifest.get(key, {"file_hash": None, "chunks": {}})
+            if not os.path.exists(path):
+                removed.extend(old["chunks"])
+                self.manifest.pop(key, None)
+                continue
+
+            source = Path(path).read_text(encoding="utf-8", errors="replace")
+            file_hash = content_hash(source)
+            if file_hash == old["file_hash"]:
+                continue  # untouched file, nothing to split
+
+            documents = split_python(source, key, self.max_chunk_chars)
+            chunks = {doc.metadata["chunk_id"]: doc.metadata["hash"] for doc in documents}
+            changed.extend(doc for doc in documents if old["chunks"].get(doc.metadata["chunk_id"]) != doc.metadata["hash"])
+            removed.extend(chunk_id for chunk_id in old["chunks"] if chunk_id not in chunks)
+            self.manifest[key] = {"file_hash": file_hash, "chunks": chunks}
+        return changed, removed
+
+    def save(self):
+        save_manifest(self.manifest_path, self.manifest)
+
+
+def python_files(root):
+    return [str(p) for p in Path(root).rglob("*.py") if ".git" not in p.parts]
+
+
+def changed_python_files(repo_root, since="HEAD~1"):
+    """Python files under repo_root changed between `since` and the working tree, including deletions.
+
+    --relative makes the names relative to repo_root (which may be a subdirectory), and
+    --no-renames lists a renamed file under both names so the old path's chunks are removed.
+    """
+    output = subprocess.run(
+        ["git", "diff", "--name-only", "--relative", "--no-renames", since, "--", "*.py"],
+        cwd=repo_root, capture_output=True, text=True, check=True,
+    ).stdout
+    return [str(Path(repo_root) / name) for name in output.splitlines() if name]
+
+
+if __name__ == "__main__":
+    import argparse
+    import tempfile
+    import time
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repo", help="index every .py file under this git repo")
+    parser.add_argument("--since", help="only re-index files changed since this git revision")
+    parser.add_argument("--manifest", default="code_manifest.json")
+    args = parser.parse_args()
+
+    if args.repo:
+        index = IncrementalCodeIndex(args.manifest)
+        paths = changed_python_files(args.repo, args.since) if args.since else python_files(args.repo)
+        start = time.perf_counter()
+        changed, removed = index.update(paths)
+        index.save()
+        print(f"{len(paths)} files checked in {time.perf_counter() - start:.2f}s: "
+              f"{len(changed)} chunks to (re-)embed, {len(removed)} to delete")
+    else:
+        # Sample Python code to split
+        text = """
+class Student:
+    def __init__(self, name, age, grade):
+        self.name = name
+        self.age = age
+        self.grade = grade  # grade is a float, e.g., 8.5 or 9.2
+
+    def get_details(self):
+        # Return the student's name
+        return self.name
+
+    def is_passing(self):
+        # Returns True if grade is 6.0 or higher
+        return self.grade >= 6.0
+
+
+# Example usage
+student1 = Student("Aarav", 20, 8.2)
+print(student1.get_details())
+
+if student1.is_passing():
+    print("The student is passing.")
+else:
+    print("The student is not passing.")
+"""
+
+        # Step 1: Split at class / function boundaries
+        chunks = split_python(text, max_chunk_chars=200)
+        print("Total chunks:", len(chunks))
+        for chunk in chunks:
+            print(f"--- {chunk.metadata['chunk_id']} (lines {chunk.metadata['start_line']}-{chunk.metadata['end_line']})")
+            print(chunk.page_content)
+
+        # Step 2: Index the file, edit one method, and re-index
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "student.py")
+            Path(path).write_text(text, encoding="utf-8")
+            index = IncrementalCodeIndex(os.path.join(tmp, "manifest.json"), max_chunk_chars=200)
+            changed, _ = index.update([path])
+            print(f"\nFirst index: {len(changed)} chunks")
+
+            Path(path).write_text(text.replace(">= 6.0", ">= 5.0"), encoding="utf-8")
+            changed, removed = index.update([path])
+            print(f"After editing is_passing: {[doc.metadata['qualname'] for doc in changed]} changed, "
+                  f"{len(removed)} removed")
@@ -0,0 +1,209 @@
+"""
+Local Semantic Splitting Example
+Semantic_Spliting.py sends every sentence to OpenAIEmbeddings over the network.
+This version runs fully offline on all-MiniLM-L6-v2 and is built for large corpora:
+  - each sentence is embedded ONCE, in large batches, and kept in a per-sentence
+    cache (SemanticChunker embeds every sentence again inside each neighbouring window)
+  - the buffered window vectors ("sentence + neighbours") are the mean of the
+    sentence vectors, computed for all windows at once with a cumulative sum
+  - distances and breakpoint thresholds are plain vectorized NumPy
+  - encoding uses every core: torch threads by default, or one process per core
+    with processes=N (the worker pool is started once and kept until close())
+
+LocalSentenceEmbeddings is a regular langchain Embeddings, so it can also be
+passed straight to SemanticChunker.
+"""
+
+import hashlib
+import os
+import re
+from collections import OrderedDict
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+class LocalSentenceEmbeddings(Embeddings):
+    """Batched local sentence-transformers embeddings with an in-memory per-sentence cache."""
+
+    # 50k cached 384-d float32 vectors is ~77 MB
+    def __init__(self, model_name=MODEL_NAME, batch_size=256, max_cache=50_000, processes=1, model=None):
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.max_cache = max_cache
+        self.processes = processes
+        self._model = model
+        self._pool = None
+        self._cache = OrderedDict()  # sha1(sentence) -> normalized float32 vector
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def model(self):
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+            self._model = SentenceTransformer(self.model_name, device="cpu")
+        return self._model
+
+    def close(self):
+        """Stop the multi-process pool, if one was started."""
+        if self._pool is not None:
+            self.model.stop_multi_process_pool(self._pool)
+            self._pool = None
+
+    def _encode(self, sentences):
+        if self.processes > 1 and len(sentences) >= self.batch_size * self.processes:
+            if self._pool is None:
+                # Spawning the workers loads the model in each one, so it is done once, not per call
+                self._pool = self.model.start_multi_process_pool(["cpu"] * self.processes)
+            vectors = self.model.encode_multi_process(sentences, self._pool, batch_size=self.batch_size)
+        else:
+            vectors = self.model.encode(sentences, batch_size=self.batch_size, convert_to_numpy=True)
+        vectors = np.asarray(vectors, dtype=np.float32)
+        return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+
+    def embed_array(self, sentences):
+        """Return an (n, dim) array, encoding only sentences that are not cached yet."""
+        keys = [hashlib.sha1(s.encode("utf-8")).digest() for s in sentences]
+        missing = {}
+        for key, sentence in zip(keys, sentences):
+            if key in self._cache:
+                self._cache.move_to_end(key)
+            elif key not in missing:
+                missing[key] = sentence
+        self.misses += len(missing)
+        self.hits += len(sentences) - len(missing)
+
+        if missing:
+            vectors = self._encode(list(missing.values()))
+            fresh = dict(zip(missing, vectors))
+            for key, vector in fresh.items():
+                self._cache[key] = vector
+            while len(self._cache) > self.max_cache:
+                self._cache.popitem(last=False)
+        else:
+            fresh = {}
+
+        return np.stack([fresh[key] if key in fresh else self._cache[key] for key in keys])
+
+    def embed_documents(self, texts):
+        return self.embed_array(texts).tolist()
+
+    def embed_query(self, text):
+        return self.embed_array([text])[0].tolist()
+
+
+def window_vectors(vectors, buffer_size):
+    """Mean of each sentence's vector with `buffer_size` neighbours on both sides, all at once."""
+    n = len(vectors)
+    cumsum = np.vstack([np.zeros((1, vectors.shape[1]), dtype=vectors.dtype), np.cumsum(vectors, axis=0)])
+    idx = np.arange(n)
+    lo = np.maximum(idx - buffer_size, 0)
+    hi = np.minimum(idx + buffer_size + 1, n)
+    windows = (cumsum[hi] - cumsum[lo]) / (hi - lo)[:, None]
+    return windows / np.maximum(np.linalg.norm(windows, axis=1, keepdims=True), 1e-12)
+
+
+def breakpoint_threshold(distances, threshold_type, amount):
+    if threshold_type == "percentile":
+        return np.percentile(distances, amount)
+    if threshold_type == "standard_deviation":
+        return distances.mean() + amount * distances.std()
+    if threshold_type == "interquartile":
+        q1, q3 = np.percentile(distances, [25, 75])
+        return distances.mean() + amount * (q3 - q1)
+    raise ValueError(f"Unknown breakpoint_threshold_type {threshold_type!r}")
+
+
+class LocalSemanticChunker:
+    """Split text where the meaning shifts, using local cached embeddings.
+
+    `embeddings` defaults to LocalSentenceEmbeddings; any other langchain Embeddings works too,
+    without the per-sentence cache.
+    """
+
+    DEFAULT_AMOUNTS = {"percentile": 95, "standard_deviation": 3, "interquartile": 1.5, "gradient": 95}
+
+    def __init__(self, embeddings=None, breakpoint_threshold_type="percentile",
+                 breakpoint_threshold_amount=None, buffer_size=1,
+                 sentence_split_regex=r"(?<=[.?!])\s+"):
+        self.embeddings = embeddings or LocalSentenceEmbeddings()
+        self.threshold_type = breakpoint_threshold_type
+        self.amount = (self.DEFAULT_AMOUNTS[breakpoint_threshold_type] if breakpoint_threshold_amount is None
+                       else breakpoint_threshold_amount)
+        self.buffer_size = buffer_size
+        self.sentence_split = re.compile(sentence_split_regex)
+
+    def _embed(self, sentences):
+        if hasattr(self.embeddings, "embed_array"):
+            return self.embeddings.embed_array(sentences)
+        # Any other langchain Embeddings: no per-sentence cache, vectors normalized here
+        vectors = np.asarray(self.embeddings.embed_documents(sentences), dtype=np.float32)
+        return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+
+    def _chunk(self, sentences, vectors):
+        if len(sentences) < 2:
+            return [" ".join(sentences)] if sentences else []
+        windows = window_vectors(vectors, self.buffer_size)
+        distances = 1.0 - np.einsum("ij,ij->i", windows[:-1], windows[1:])
+        if self.threshold_type == "gradient":
+            scores = np.gradient(distances) if len(distances) > 1 else distances
+            breaks = np.flatnonzero(scores > np.percentile(scores, self.amount))
+        else:
+            breaks = np.flatnonzero(distances > breakpoint_threshold(distances, self.threshold_type, self.amount))
+        bounds = [0, *(breaks + 1).tolist(), len(sentences)]
+        return [" ".join(sentences[a:b]) for a, b in zip(bounds[:-1], bounds[1:])]
+
+    def split_texts(self, texts):
+        # Step 1: Sentences of every text, embedded together in one batched pass
+        per_text = [[s for s in self.sentence_split.split(text.strip()) if s] for text in texts]
+        flat = [s for sentences in per_text for s in sentences]
+        vectors = self._embed(flat) if flat else None
+
+        # Step 2: Breakpoints per text on slices of the shared array
+        chunks, offset = [], 0
+        for sentences in per_text:
+            chunks.append(self._chunk(sentences, vectors[offset:offset + len(sentences)] if sentences else None))
+            offset += len(sentences)
+        return chunks
+
+    def create_documents(self, texts, metadatas=None):
+        metadatas = metadatas or [{}] * len(texts)
+        return [
+            Document(page_content=chunk, metadata=dict(metadata))
+            for chunks, metadata in zip(self.split_texts(texts), metadatas)
+            for chunk in chunks
+        ]
+
+
+if __name__ == "__main__":
+    import time
+
+    text_splitter = LocalSemanticChunker(
+        LocalSentenceEmbeddings(batch_size=256, processes=1),
+        breakpoint_threshold_type="standard_deviation",
+        breakpoint_threshold_amount=3,
+    )
+
+    sample = """
+Farmers were working hard in the fields, preparing the soil and planting seeds for the next season. The sun was bright, and the air smelled of earth and fresh grass. The Indian Premier League (IPL) is the biggest cricket league in the world. People all over the world watch the matches and cheer for their favourite teams.
+
+
+Terrorism is a big danger to peace and safety. It causes harm to people and creates fear in cities and villages. When such attacks happen, they leave behind pain and sadness. To fight terrorism, we need strong laws, alert security forces, and support from people who care about peace and safety.
+"""
+
+    docs = text_splitter.create_documents([sample])
+    print(len(docs))
+    print(docs)
+
+    # Bigger run: repeated sentences are served from the cache
+    corpus = [sample] * 2000
+    start = time.perf_counter()
+    text_splitter.split_texts(corpus)
+    embeddings = text_splitter.embeddings
+    print(f"\n{len(corpus)} texts in {time.perf_counter() - start:.2f}s on {os.cpu_count()} cores, "
+          f"cache hits={embeddings.hits} misses={embeddings.misses}")
+    embeddings.close()
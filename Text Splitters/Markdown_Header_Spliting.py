@@ -0,0 +1,209 @@
+"""
+Markdown Header Splitting Example
+Markdown_Spliting.py splits Markdown by character count, which loses which
+section a chunk came from and re-chunks the whole document on every change.
+This splitter makes one pass over the lines and:
+  - starts a new section at every ATX heading (#, ##, ...), and stores the full
+    heading breadcrumb in metadata, e.g. ["Project Name", "Getting Started"]
+  - never treats lines inside ``` / ~~~ code fences as headings and never cuts a
+    fence in half; like CommonMark, an unclosed fence runs to the end of the
+    document (the chunk is flagged with unclosed_fence=True)
+  - splits long sections at blank lines, packing blocks up to chunk_size
+  - gives chunks section-scoped ids ("README.md::getting-started#0"), so MarkdownIndex
+    only re-chunks and re-embeds the sections whose content hash changed
+"""
+
+import json
+import re
+from pathlib import Path
+
+from langchain_core.documents import Document
+
+from manifest_utils import content_hash, load_manifest, save_manifest
+
+HEADING = re.compile(r"^ {0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$")
+FENCE = re.compile(r"^\s*(`{3,}|~{3,})")
+
+
+def _slug(title):
+    slug = re.sub(r"[^\w\s-]", "", title.lower()).strip()
+    return re.sub(r"[\s_-]+", "-", slug) or "section"
+
+
+def parse_sections(text):
+    """One pass over the lines -> [{"id", "breadcrumb", "level", "blocks", "unclosed_fence"}].
+
+    `blocks` are the section's paragraphs and code fences; a fence is always one block.
+    """
+    sections = []
+    stack = []           # [(level, title, slug)] of the enclosing headings
+    seen_ids = {}
+    section = {"id": "<preamble>", "breadcrumb": [], "level": 0, "blocks": [], "unclosed_fence": False}
+    block = []
+    fence = None         # the opening marker while inside a code fence
+
+    def end_block():
+        if any(line.strip() for line in block):
+            section["blocks"].append("\n".join(block).strip("\n"))
+        block.clear()
+
+    for line in text.splitlines():
+        if fence is not None:
+            block.append(line)
+            match = FENCE.match(line)
+            if match and match.group(1)[0] == fence[0] and len(match.group(1)) >= len(fence) \
+                    and not line.strip()[len(match.group(1)):].strip():
+                fence = None
+                end_block()
+            continue
+
+        match = FENCE.match(line)
+        if match:
+            end_block()
+            fence = match.group(1)
+            block.append(line)
+            continue
+
+        heading = HEADING.match(line)
+        if heading:
+            end_block()
+            if section["blocks"]:
+                sections.append(section)
+            level, title = len(heading.group(1)), (heading.group(2) or "").strip()
+            while stack and stack[-1][0] >= level:
+                stack.pop()
+            stack.append((level, title, _slug(title)))
+            section_id = "/".join(slug for _, _, slug in stack)
+            seen_ids[section_id] = seen_ids.get(section_id, 0) + 1
+            if seen_ids[section_id] > 1:
+                section_id = f"{section_id}~{seen_ids[section_id]}"  # repeated heading text
+            section = {
+                "id": section_id,
+                "breadcrumb": [title for _, title, _ in stack],
+                "level": level,
+                "blocks": [line.strip()],
+                "unclosed_fence": False,
+            }
+            continue
+
+        if line.strip():
+            block.append(line)
+        else:
+            end_block()
+
+    if fence is not None:
+        section["unclosed_fence"] = True
+    end_block()
+    if section["blocks"]:
+        sections.append(section)
+    return sections
+
+
+def chunk_section(section, chunk_size, source=None):
+    """Pack a section's blocks into chunks of up to chunk_size characters."""
+    chunks, current = [], []
+    size = 0
+    for block in section["blocks"]:
+        if current and size + len(block) + 2 > chunk_size:
+            chunks.append("\n\n".join(current))
+            current, size = [], 0
+        current.append(block)  # a block longer than chunk_size (e.g. a big fence) stays whole
+        size += len(block) + 2
+    if current:
+        chunks.append("\n\n".join(current))
+
+    return [
+        Document(page_content=content, metadata={
+            **({"source": source} if source else {}),
+            "chunk_id": f"{source}::{section['id']}#{i}" if source else f"{section['id']}#{i}",
+            "section_id": section["id"],
+            "breadcrumb": section["breadcrumb"],
+            "heading_level": section["level"],
+            **({"unclosed_fence": True} if section["unclosed_fence"] and i == len(chunks) - 1 else {}),
+        })
+        for i, content in enumerate(chunks)
+    ]
+
+
+def split_markdown(text, chunk_size=500, source=None):
+    return [doc for section in parse_sections(text) for doc in chunk_section(section, chunk_size, source)]
+
+
+class MarkdownIndex:
+    """Keeps one content hash per section in a JSON manifest and re-chunks only changed sections."""
+
+    def __init__(self, manifest_path="markdown_manifest.json", chunk_size=500):
+        self.manifest_path = Path(manifest_path)
+        self.chunk_size = chunk_size
+        self.manifest = load_manifest(self.manifest_path)  # source -> {section_id: {"hash": ..., "chunks": [chunk_id, ...]}}
+
+    def update(self, source, text):
+        """Returns (changed_documents, removed_chunk_ids) for one Markdown document."""
+        old = self.manifest.get(source, {})
+        new = {}
+        changed, removed = [], []
+        for section in parse_sections(text):
+            section_hash = content_hash(json.dumps([section["breadcrumb"], section["blocks"]]))
+            previous = old.get(section["id"])
+            if previous and previous["hash"] == section_hash:
+                new[section["id"]] = previous
+                continue
+            documents = chunk_section(section, self.chunk_size, source)
+            chunk_ids = [doc.metadata["chunk_id"] for doc in documents]
+            changed.extend(documents)
+            if previous:
+                removed.extend(chunk_id for chunk_id in previous["chunks"] if chunk_id not in chunk_ids)
+            new[section["id"]] = {"hash": section_hash, "chunks": chunk_ids}
+
+        for section_id, previous in old.items():
+            if section_id not in new:
+                removed.extend(previous["chunks"])
+        self.manifest[source] = new
+        return changed, removed
+
+    def save(self):
+        save_manifest(self.manifest_path, self.manifest)
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    text = """
+# Project Name: Smart Student Tracker
+
+A simple Python-based project to manage and track student data, including their grades, age, and academic status.
+
+## Features
+- Add new students with relevant info
+- View student details
+- Check if a student is passing
+- Easily extendable class-based design
+
+## 🛠 Tech Stack
+- Python 3.10+
+- No external dependencies
+
+## Getting Started
+1. Clone the repo
+   ```bash
+   git clone https://github.com/your-username/student-tracker.git
+
+"""
+
+    # Step 1: Split by heading hierarchy
+    chunks = split_markdown(text, chunk_size=200)
+    print(len(chunks))
+    for chunk in chunks:
+        print(f"--- {chunk.metadata['chunk_id']}  {' > '.join(chunk.metadata['breadcrumb'])}")
+        print(chunk.page_content)
+
+    # Step 2: Edit one section; only its chunks come back
+    with tempfile.TemporaryDirectory() as tmp:
+        index = MarkdownIndex(os.path.join(tmp, "manifest.json"), chunk_size=200)
+        changed, _ = index.update("README.md", text)
+        print(f"\nFirst index: {len(changed)} chunks")
+
+        changed, removed = index.update("README.md", text.replace("Python 3.10+", "Python 3.12+"))
+        print(f"After editing Tech Stack: {[doc.metadata['chunk_id'] for doc in changed]} changed, "
+              f"{removed} removed")
@@ -0,0 +1,120 @@
+"""
+Offset-Based Length Splitter Example
+Length_based.py uses CharacterTextSplitter(separator=""), which breaks every page
+into single characters and glues them back together, allocating a string per
+character. For a fixed-length split we only need positions, so this splitter:
+  - computes each chunk as (start, end) character offsets, nothing else
+  - streams pages in order and lets chunks cross page boundaries, keeping only
+    the pages the current chunk still needs
+  - builds the chunk string only when .text is read (or when Documents are asked for)
+  - records the offsets in metadata: start_index / end_index in the whole stream,
+    plus the (page, start, end) pieces the chunk was cut from
+"""
+
+from collections import deque
+
+from langchain_core.documents import Document
+
+
+class Chunk:
+    """A span of the page stream; the text is sliced out only on demand."""
+
+    __slots__ = ("start", "end", "pieces")
+
+    def __init__(self, start, end, pieces):
+        self.start = start
+        self.end = end
+        self.pieces = pieces  # [(page_text, page_metadata, local_start, local_end), ...]
+
+    @property
+    def text(self):
+        if len(self.pieces) == 1:
+            text, _, start, end = self.pieces[0]
+            return text[start:end]
+        return "".join(text[start:end] for text, _, start, end in self.pieces)
+
+    @property
+    def metadata(self):
+        first = self.pieces[0][1]
+        return {
+            **first,
+            "start_index": self.start,
+            "end_index": self.end,
+            "spans": [(meta.get("page"), start, end) for _, meta, start, end in self.pieces],
+        }
+
+    def __len__(self):
+        return self.end - self.start
+
+
+class OffsetLengthSplitter:
+    """Fixed-size character chunks, computed as offsets over a stream of pages."""
+
+    def __init__(self, chunk_size=200, chunk_overlap=0):
+        if chunk_overlap >= chunk_size:
+            raise ValueError(f"chunk_overlap ({chunk_overlap}) must be smaller than chunk_size ({chunk_size})")
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+
+    def _cut(self, window, start, end):
+        pieces = []
+        for page_start, text, metadata in window:
+            page_end = page_start + len(text)
+            if page_end <= start:
+                continue
+            if page_start >= end:
+                break
+            pieces.append((text, metadata, max(start, page_start) - page_start, min(end, page_end) - page_start))
+        return Chunk(start, end, pieces)
+
+    def iter_chunks(self, documents):
+        """Yield Chunk spans over `documents` (any iterable, e.g. loader.lazy_load())."""
+        step = self.chunk_size - self.chunk_overlap
+        window = deque()  # (global start, text, metadata) of pages still needed
+        total = 0         # characters seen so far
+        next_start = 0
+        last_end = 0
+
+        for document in documents:
+            text = document.page_content
+            if not text:
+                continue
+            window.append((total, text, document.metadata))
+            total += len(text)
+
+            while next_start + self.chunk_size <= total:
+                last_end = next_start + self.chunk_size
+                yield self._cut(window, next_start, last_end)
+                next_start += step
+                # Drop pages that end before the next chunk begins
+                while window and window[0][0] + len(window[0][1]) <= next_start:
+                    window.popleft()
+
+        if total > last_end:
+            yield self._cut(window, next_start, total)
+
+    def lazy_split_documents(self, documents):
+        for chunk in self.iter_chunks(documents):
+            yield Document(page_content=chunk.text, metadata=chunk.metadata)
+
+    def split_documents(self, documents):
+        return list(self.lazy_split_documents(documents))
+
+
+if __name__ == "__main__":
+    from langchain_community.document_loaders import PyPDFLoader
+
+    # Load the PDF lazily, page by page
+    loader = PyPDFLoader("OOP Unit 5 Notes.pdf")
+
+    splitter = OffsetLengthSplitter(chunk_size=200, chunk_overlap=0)
+
+    # Only offsets are computed here; strings are built just for the chunk we print
+    chunks = list(splitter.iter_chunks(loader.lazy_load()))
+    print(f"{len(chunks)} chunks")
+
+    if len(chunks) > 1:
+        print(chunks[1].metadata)
+        print(chunks[1].text)
+    else:
+        print("Not enough chunks to display the second one.")
@@ -0,0 +1,81 @@
+"""
+Length Splitter Benchmark
+Measures throughput (MB/s of page text) of:
+  - CharacterTextSplitter(separator="") as used in Length_based.py
+  - OffsetLengthSplitter, offsets only (iter_chunks)
+  - OffsetLengthSplitter, materialized Documents (split_documents)
+on synthetic pages, or on a PDF with --pdf.
+
+Usage:
+  python benchmark_splitters.py --pages 200 --page-chars 3000
+  python benchmark_splitters.py --pdf "OOP Unit 5 Notes.pdf"
+"""
+
+import argparse
+import random
+import time
+
+from langchain.text_splitter import CharacterTextSplitter
+from langchain_core.documents import Document
+
+from Offset_Length_Splitter import OffsetLengthSplitter
+
+
+def synthetic_pages(num_pages, page_chars, seed=0):
+    rng = random.Random(seed)
+    words = "class object method inherit polymorphism interface exception thread stream".split()
+    pages = []
+    for page in range(num_pages):
+        text = []
+        size = 0
+        while size < page_chars:
+            word = rng.choice(words)
+            text.append(word)
+            size += len(word) + 1
+        pages.append(Document(page_content=" ".join(text)[:page_chars], metadata={"page": page}))
+    return pages
+
+
+def throughput(fn, megabytes, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        count = fn()
+        best = min(best, time.perf_counter() - start)
+    return {"chunks": count, "seconds": round(best, 4), "mb_per_s": round(megabytes / best, 2)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pdf")
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--page-chars", type=int, default=3000)
+    parser.add_argument("--chunk-size", type=int, default=200)
+    parser.add_argument("--chunk-overlap", type=int, default=0)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.pdf:
+        from langchain_community.document_loaders import PyPDFLoader
+        pages = PyPDFLoader(args.pdf).load()
+    else:
+        pages = synthetic_pages(args.pages, args.page_chars)
+    megabytes = sum(len(p.page_content.encode("utf-8")) for p in pages) / 1e6
+    print(f"{len(pages)} pages, {megabytes:.2f} MB of text\n")
+
+    character = CharacterTextSplitter(chunk_size=args.chunk_size, chunk_overlap=args.chunk_overlap, separator="")
+    offsets = OffsetLengthSplitter(chunk_size=args.chunk_size, chunk_overlap=args.chunk_overlap)
+
+    results = {
+        "CharacterTextSplitter": throughput(lambda: len(character.split_documents(pages)), megabytes, args.repeats),
+        "OffsetLengthSplitter (offsets)": throughput(
+            lambda: sum(1 for _ in offsets.iter_chunks(pages)), megabytes, args.repeats),
+        "OffsetLengthSplitter (documents)": throughput(
+            lambda: len(offsets.split_documents(pages)), megabytes, args.repeats),
+    }
+    for name, result in results.items():
+        print(f"{name:<34} {result}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""
+Small helpers shared by the incremental splitters in this folder
+(AST_Code_Spliting.py and Markdown_Header_Spliting.py).
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+
+def content_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def load_manifest(path):
+    """The JSON manifest at `path`, or {} if it does not exist yet."""
+    path = Path(path)
+    if path.exists():
+        return json.loads(path.read_text(encoding="utf-8"))
+    return {}
+
+
+def save_manifest(path, manifest):
+    """Write the manifest atomically, so an interrupted save never leaves half a file."""
+    path = Path(path)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, indent=1), encoding="utf-8")
+    tmp.replace(path)
@@ -0,0 +1,112 @@
+"""
+Incremental Chroma Upsert
+Adds documents to a Chroma store without duplicating or re-embedding them.
+  - every document gets a stable ID derived from a hash (of its content, or of
+    a key such as its source path when `key_fn` is given)
+  - the content hash is stored in metadata, so unchanged documents are skipped
+  - only new or changed documents are embedded, in batches sized to the
+    Chroma client's maximum insert batch
+"""
+
+import hashlib
+import json
+
+from langchain_core.documents import Document
+
+HASH_FIELD = "content_hash"
+
+
+def content_hash(doc):
+    """Hash of the page content and metadata (minus our own hash field)."""
+    metadata = {k: v for k, v in doc.metadata.items() if k != HASH_FIELD}
+    payload = json.dumps({"content": doc.page_content, "metadata": metadata}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _max_batch_size(vector_store, default=5000):
+    client = vector_store._client
+    if hasattr(client, "get_max_batch_size"):
+        return client.get_max_batch_size()
+    return getattr(client, "max_batch_size", default)
+
+
+def upsert_documents(vector_store, docs, key_fn=None, batch_size=None):
+    """Insert new/changed documents into `vector_store` and skip unchanged ones.
+
+    Returns (ids, stats) where ids line up with `docs`.
+    """
+    collection = vector_store._collection
+    embeddings = vector_store._embedding_function
+    batch_size = batch_size or _max_batch_size(vector_store)
+
+    # Later duplicates win, like a dict update
+    records = {}
+    ids = []
+    for doc in docs:
+        digest = content_hash(doc)
+        key = key_fn(doc) if key_fn else digest
+        doc_id = hashlib.sha256(key.encode("utf-8")).hexdigest() if key_fn else digest
+        records[doc_id] = (doc, digest)
+        ids.append(doc_id)
+
+    stats = {"total": len(records), "skipped": 0, "written": 0}
+    unique_ids = list(records)
+    for start in range(0, len(unique_ids), batch_size):
+        batch_ids = unique_ids[start:start + batch_size]
+
+        # One round trip tells us which documents are already stored unchanged
+        existing = collection.get(ids=batch_ids, include=["metadatas"])
+        stored = {
+            doc_id: (meta or {}).get(HASH_FIELD)
+            for doc_id, meta in zip(existing["ids"], existing["metadatas"])
+        }
+        changed = [doc_id for doc_id in batch_ids if stored.get(doc_id) != records[doc_id][1]]
+        stats["skipped"] += len(batch_ids) - len(changed)
+        if not changed:
+            continue
+
+        texts = [records[doc_id][0].page_content for doc_id in changed]
+        metadatas = [{**records[doc_id][0].metadata, HASH_FIELD: records[doc_id][1]} for doc_id in changed]
+        collection.upsert(
+            ids=changed,
+            documents=texts,
+            metadatas=metadatas,
+            embeddings=embeddings.embed_documents(texts),
+        )
+        stats["written"] += len(changed)
+
+    return ids, stats
+
+
+if __name__ == "__main__":
+    from langchain_community.vectorstores import Chroma
+    from langchain_huggingface import HuggingFaceEmbeddings
+
+    embeddings = HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2")
+    vector_store = Chroma(
+        embedding_function=embeddings,
+        persist_directory='travel_chroma_db',
+        collection_name='destinations'
+    )
+
+    docs = [
+        Document(page_content="Paris, the City of Light, is famous for the Eiffel Tower.", metadata={"country": "France"}),
+        Document(page_content="Bali, Indonesia is a tropical paradise known for its beaches.", metadata={"country": "Indonesia"}),
+    ]
+
+    # Documents are keyed by country, so an edited description replaces its old version
+    def by_country(doc):
+        return doc.metadata["country"]
+
+    # Step 1: First run writes both documents
+    ids, stats = upsert_documents(vector_store, docs, key_fn=by_country)
+    print(f"First run:  {stats}")
+
+    # Step 2: Second run finds nothing to embed
+    ids, stats = upsert_documents(vector_store, docs, key_fn=by_country)
+    print(f"Second run: {stats}")
+
+    # Step 3: Only the edited document is re-embedded
+    docs[0] = Document(page_content="Paris is home to the Louvre and the Seine.", metadata={"country": "France"})
+    ids, stats = upsert_documents(vector_store, docs, key_fn=by_country)
+    print(f"After edit: {stats}")
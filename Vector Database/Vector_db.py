@@ -8,6 +8,7 @@ os.environ["HUGGINGFACEHUB_API_TOKEN"] = "***REMOVED***"
 from langchain_huggingface import HuggingFaceEmbeddings
 from langchain.vectorstores import Chroma
 from langchain.schema import Document
+from Chroma_Upsert import upsert_documents
 
 # Initialize HuggingFace embeddings
 embeddings = HuggingFaceEmbeddings(
@@ -50,10 +51,15 @@ vector_store = Chroma(
     collection_name='destinations'
 )
 
-# Add documents
+# Add documents. Each ID is the hash of the country, so an edited description
+# replaces its old version and re-runs skip unchanged documents.
+def by_country(doc):
+    return doc.metadata["country"]
+
 print("Adding documents...")
-doc_ids = vector_store.add_documents(docs)
-print(f"Added documents with IDs: {doc_ids}")
+doc_ids, stats = upsert_documents(vector_store, docs, key_fn=by_country)
+print(f"Upserted documents with IDs: {doc_ids}")
+print(f"Written: {stats['written']}, unchanged: {stats['skipped']}")
 
 # View all documents
 print("\n=== All Documents ===")
@@ -90,31 +96,18 @@ for doc, score in filtered_results:
     print(f"\nScore: {score:.4f}")
     print(f"{doc.metadata}: {doc.page_content}")
 
-# Update a document
-print("\n=== Updating Document ===")
-updated_doc1 = Document(
-    page_content="Paris, the capital of France, is one of the world's most visited cities. Beyond the iconic Eiffel Tower, visitors can explore the Louvre Museum housing the Mona Lisa, stroll through Montmartre's artistic streets, enjoy haute cuisine in Michelin-starred restaurants, and cruise along the Seine River. The city's boulevards, gardens, and architecture make it a timeless destination for romance and culture.",
-    metadata={"country": "France", "type": "city"}
-)
-
-vector_store.update_document(document_id=doc_ids[0], document=updated_doc1)
-print(f"Updated document {doc_ids[0]}")
-
-# View updated documents
-print("\n=== Documents After Update ===")
-all_docs = vector_store.get(include=['documents', 'metadatas'])
-print(f"First document now: {all_docs['documents'][0][:150]}...")
-
-# Delete a document
-print(f"\n=== Deleting Document {doc_ids[0]} ===")
-vector_store.delete(ids=[doc_ids[0]])
-print("Document deleted")
-
-# View remaining documents
-print("\n=== Remaining Documents ===")
-remaining = vector_store.get(include=['documents', 'metadatas'])
-print(f"Number of documents: {len(remaining['ids'])}")
-for i, (doc_id, doc, meta) in enumerate(zip(remaining['ids'], remaining['documents'], remaining['metadatas'])):
+# Re-running the same upsert is a no-op. To update a destination, edit its
+# Document in `docs` and run again: the country key keeps its ID, so only that
+# document is re-embedded (see Chroma_Upsert.py).
+print("\n=== Upserting Again ===")
+doc_ids, stats = upsert_documents(vector_store, docs, key_fn=by_country)
+print(f"Written: {stats['written']}, unchanged: {stats['skipped']}")
+
+# View stored documents
+print("\n=== Stored Documents ===")
+stored = vector_store.get(include=['documents', 'metadatas'])
+print(f"Number of documents: {len(stored['ids'])}")
+for i, (doc_id, doc, meta) in enumerate(zip(stored['ids'], stored['documents'], stored['metadatas'])):
     print(f"\n{i+1}. ID: {doc_id}")
     print(f"   Metadata: {meta}")
-    print(f"   Content: {doc[:80]}...")
\ No newline at end of file
+    print(f"   Content: {doc[:80]}...")